@@ -0,0 +1,502 @@
+"""Timings of common operations, for large numbers of arguments
+
+Usage:
+    $ python bench.py
+
+"""
+
+import os
+import sys
+import array
+import time
+import shutil
+import tempfile
+import tracemalloc
+import contextlib
+
+from Qt import QtWidgets, QtCore, QtGui
+import qargparse
+
+_app = QtWidgets.QApplication(sys.argv)
+
+
+@contextlib.contextmanager
+def __timing__(title):
+    sys.stdout.write("%-48s" % title)
+    sys.stdout.flush()
+    start = time.time()
+    yield
+    sys.stdout.write(" %8.1f ms\n" % ((time.time() - start) * 1000))
+
+
+def _arguments(count):
+    """Return `count` arguments of mixed types"""
+    types = (
+        qargparse.Boolean,
+        qargparse.Integer,
+        qargparse.Float,
+        qargparse.String,
+    )
+
+    return [
+        types[index % len(types)]("arg%d" % index)
+        for index in range(count)
+    ]
+
+
+for count in (10, 100, 1000, 5000):
+    arguments = _arguments(count)
+    with __timing__("Construct with %d arguments.." % count):
+        parser = qargparse.QArgumentParser(arguments)
+    parser.deleteLater()
+
+    arguments = _arguments(count)
+    with __timing__("Construct virtual with %d arguments.." % count):
+        parser = qargparse.QArgumentParser(arguments, virtual=True)
+        parser.show()
+        _app.processEvents()
+    parser.deleteLater()
+
+    arguments = _arguments(count)
+    parser = qargparse.QArgumentParser()
+    with __timing__("Add %d arguments one at a time.." % count):
+        for arg in arguments:
+            parser.addArgument(arg["name"], type=type(arg))
+    parser.deleteLater()
+
+    _app.processEvents()
+
+
+for count in (100, 1000):
+    arguments = _arguments(count)
+    tracemalloc.start()
+    parser = qargparse.QArgumentParser(arguments)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    sys.stdout.write("%-48s %8.1f kB\n" % (
+        "Python memory per argument, of %d.." % count, size / 1024.0 / count
+    ))
+    parser.deleteLater()
+    _app.processEvents()
+
+
+tracemalloc.start()
+arguments = _arguments(10000)
+size, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+sys.stdout.write("%-48s %8.1f kB\n" % (
+    "Python memory per headless argument, of 10000..", size / 1024.0 / 10000
+))
+
+arguments = _arguments(1000)
+with __timing__("Read state of 1000 arguments, 100 times.."):
+    for _ in range(100):
+        for arg in arguments:
+            arg["name"], arg["enabled"], arg["edited"], arg["default"]
+
+
+tempdir = tempfile.mkdtemp()
+values = dict(("arg%d" % index, index) for index in range(5000))
+qargparse.SnapshotStorage.write(os.path.join(tempdir, "snapshot.bin"), values)
+
+for name, Storage in (
+    ("QSettings", lambda fname: qargparse.QSettingsStorage(
+        QtCore.QSettings(fname, QtCore.QSettings.IniFormat))),
+    ("JSON", qargparse.JsonStorage),
+    ("SQLite", qargparse.SqliteStorage),
+):
+    storage = Storage(os.path.join(tempdir, name))
+    with __timing__("Save 5000 values to %s.." % name):
+        storage.save_many(values)
+
+    storage = Storage(os.path.join(tempdir, name))
+    with __timing__("Load 5000 values from %s.." % name):
+        storage.load_all()
+
+storage = qargparse.SnapshotStorage(os.path.join(tempdir, "snapshot.bin"))
+with __timing__("Load 100 of 5000 values from snapshot.."):
+    snapshot = storage.load_all()
+    for index in range(100):
+        snapshot.get("arg%d" % index)
+
+shutil.rmtree(tempdir)
+
+
+for count in (10000, 100000, 1000000):
+    table = qargparse.Table("table")
+    container = table.create()
+    view = container.findChild(qargparse.GenericTreeView)
+    model = table._model
+    items = [
+        {QtCore.Qt.DisplayRole: ("key%d" % row, "value")}
+        for row in range(count)
+    ]
+
+    with __timing__("Reset table with %d rows.." % count):
+        table.reset(items)
+
+    indexes = [model.index(row, 0) for row in range(0, count, count // 1000)]
+    with __timing__("Parent of 1000 rows, of %d.." % count):
+        for index in indexes:
+            item = index.internalPointer()
+            model.parent(index)
+            item.row()
+
+    changed = list(items)
+    for row in range(0, count, count // 10):
+        changed[row] = {QtCore.Qt.DisplayRole: ("key%d" % row, "changed")}
+    del changed[count // 2]
+
+    with __timing__("Diff reset of 11 rows, of %d.." % count):
+        table.diff_reset(changed)
+
+    container.resize(400, 400)
+    container.show()
+    _app.processEvents()
+
+    scrollbar = view.verticalScrollBar()
+    with __timing__("Scroll and paint 100 pages of %d rows.." % count):
+        for page in range(100):
+            scrollbar.setValue(scrollbar.maximum() * page // 100)
+            view.viewport().repaint()
+
+    container.deleteLater()
+    _app.processEvents()
+
+
+count = 500000
+for name, make in (
+    ("items", lambda: qargparse.Table("table", items=[
+        {QtCore.Qt.DisplayRole: ("key%d" % row, float(row))}
+        for row in range(count)
+    ])),
+    ("columns", lambda: qargparse.Table("table", columns=[
+        ["key%d" % row for row in range(count)],
+        array.array("d", range(count)),
+    ])),
+):
+    tracemalloc.start()
+    table = make()
+    container = table.create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    sys.stdout.write("%-48s %8.1f MB\n" % (
+        "Python memory of %d rows, by %s.." % (count, name),
+        size / 1024.0 / 1024.0
+    ))
+
+    view = container.findChild(qargparse.GenericTreeView)
+    container.resize(400, 400)
+    container.show()
+    _app.processEvents()
+
+    scrollbar = view.verticalScrollBar()
+    with __timing__("Scroll and paint 100 pages, by %s.." % name):
+        for page in range(100):
+            scrollbar.setValue(scrollbar.maximum() * page // 100)
+            view.viewport().repaint()
+
+    container.deleteLater()
+    _app.processEvents()
+
+
+for name, items in (
+    ("list", lambda: [
+        {QtCore.Qt.DisplayRole: ("key%d" % row, "value")}
+        for row in range(count)
+    ]),
+    ("generator", lambda: (
+        {QtCore.Qt.DisplayRole: ("key%d" % row, "value")}
+        for row in range(count)
+    )),
+):
+    with __timing__("Show table of %d rows, from %s.." % (count, name)):
+        table = qargparse.Table("table", items=items())
+        container = table.create()
+        container.show()
+        _app.processEvents()
+
+    container.deleteLater()
+    _app.processEvents()
+
+
+def _settle(proxy):
+    while proxy.isPending():
+        proxy._pool.waitForDone()
+        _app.processEvents()
+
+
+table = qargparse.Table("table", sortable=True, filterable=True, columns=[
+    ["Shot%d" % ((row * 7919) % count) for row in range(count)],
+    array.array("d", range(count)),
+])
+container = table.create()
+container.show()
+view = container.findChild(qargparse.GenericTreeView)
+proxy = view.model()
+_app.processEvents()
+
+with __timing__("Sort %d rows, in the GUI thread.." % count):
+    view.sortByColumn(0, QtCore.Qt.AscendingOrder)
+
+with __timing__("Sort %d rows, in total.." % count):
+    view.sortByColumn(0, QtCore.Qt.DescendingOrder)
+    _settle(proxy)
+
+with __timing__("Filter %d rows by 5 keystrokes, in total.." % count):
+    for text in ("s", "sh", "sho", "shot", "shot1"):
+        proxy.setFilter(text)
+        _app.processEvents()
+    _settle(proxy)
+
+container.deleteLater()
+_app.processEvents()
+
+
+items = ["node%d" % index for index in range(20000)]
+
+for Argument in (qargparse.Enum, qargparse.Choice):
+    parser = qargparse.QArgumentParser()
+    arg = parser.add_argument(Argument.__name__, type=Argument, items=items)
+
+    with __timing__("Write and compare 1000 of 20000 %s items.." %
+                    Argument.__name__):
+        for index in range(0, 20000, 20):
+            arg.write(items[-1 - index])
+            arg.isEdited()
+
+    parser.deleteLater()
+    _app.processEvents()
+
+
+for lazy in (False, True):
+    parser = qargparse.QArgumentParser()
+
+    with __timing__("Show Enum of 100000 items%s.." % (
+            ", lazily" if lazy else "")):
+        parser.add_argument("asset", type=qargparse.Enum, lazy=lazy, items=(
+            "asset%d" % index for index in range(100000)
+        ))
+        parser.show()
+        _app.processEvents()
+
+    parser.deleteLater()
+    _app.processEvents()
+
+
+parser = qargparse.QArgumentParser()
+items = ["asset%d" % index for index in range(100000)]
+
+with __timing__("Show Choice of 100000 items.."):
+    parser.add_argument("asset", type=qargparse.Choice, items=items,
+                        filterable=True)
+    parser.show()
+    _app.processEvents()
+
+search = parser.findChild(QtWidgets.QLineEdit)
+with __timing__("Filter 100000 items by 6 keystrokes.."):
+    for text in ("a", "as", "ass", "asse", "asset", "asset5"):
+        search.setText(text)
+        _app.processEvents()
+
+parser.deleteLater()
+_app.processEvents()
+
+
+items = [
+    qargparse.ListItem({QtCore.Qt.DisplayRole: "item%d" % index})
+    for index in range(100000)
+]
+
+parser = qargparse.QArgumentParser()
+with __timing__("Show List of 100000 items.."):
+    arg = parser.add_argument("list", type=qargparse.List, items=items)
+    parser.show()
+    _app.processEvents()
+
+with __timing__("Reset List of 100000 items.."):
+    arg.reset(items)
+    _app.processEvents()
+
+with __timing__("Extend List by 100 items, 100 times.."):
+    for index in range(0, 10000, 100):
+        arg.extend(items[index:index + 100])
+    _app.processEvents()
+
+parser.deleteLater()
+_app.processEvents()
+
+
+parser = qargparse.QArgumentParser()
+arg = parser.add_argument("output", type=qargparse.InfoList, default=[])
+parser.show()
+_app.processEvents()
+
+with __timing__("Append 10000 lines, 100 per event.."):
+    for index in range(10000):
+        arg.append("line %d" % index)
+
+        if index % 100 == 0:
+            _app.processEvents()
+
+    _app.processEvents()
+
+parser.deleteLater()
+_app.processEvents()
+
+
+tempdir = tempfile.mkdtemp()
+paths = []
+
+for index in range(12):
+    image = QtGui.QImage(3840, 2160, QtGui.QImage.Format_RGB32)
+    image.fill(QtGui.QColor(index * 20, 100, 200))
+    paths.append(os.path.join(tempdir, "image%d.jpg" % index))
+    image.save(paths[-1])
+
+# Read anew each time, see ThumbnailCache below
+qargparse.ImageButton.thumbnails = None
+
+arguments = [qargparse.ImageButton("image%d" % index) for index in range(12)]
+parser = qargparse.QArgumentParser(arguments)
+parser.show()
+_app.processEvents()
+
+with __timing__("Write 12 4K images, in the GUI thread.."):
+    for arg, path in zip(arguments, paths):
+        arg.write(path)
+
+with __timing__("Write 12 4K images, in total.."):
+    for arg, path in zip(arguments, reversed(paths)):
+        arg.write(path)
+
+    while qargparse._ImageLoader._running:
+        qargparse._ImageLoader._pool.waitForDone()
+        _app.processEvents()
+
+parser.deleteLater()
+_app.processEvents()
+
+for name in ("disk", "memory"):
+    if name == "disk":
+        qargparse.ImageButton.thumbnails = qargparse.ThumbnailCache(
+            directory=os.path.join(tempdir, "thumbnails")
+        )
+
+        # Stored on disk, but not in memory
+        for path in paths:
+            qargparse.ImageButton.thumbnails.read(path, QtCore.QSize(
+                qargparse.px(200), qargparse.px(128)
+            ))
+
+        qargparse.ImageButton.thumbnails.clear()
+
+    arguments = [
+        qargparse.ImageButton("image%d" % index) for index in range(12)
+    ]
+    parser = qargparse.QArgumentParser(arguments)
+
+    with __timing__("Show 12 4K images, with thumbnails in %s.." % name):
+        for arg, path in zip(arguments, paths):
+            arg.write(path)
+
+        while qargparse._ImageLoader._running:
+            qargparse._ImageLoader._pool.waitForDone()
+            _app.processEvents()
+
+    parser.deleteLater()
+    _app.processEvents()
+
+shutil.rmtree(tempdir)
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    tempdir = tempfile.mkdtemp()
+    path = os.path.join(tempdir, "frame.png")
+    frame = numpy.zeros((2160, 3840, 4), numpy.uint8)
+
+    arg = qargparse.Image("preview")
+    parser = qargparse.QArgumentParser([arg])
+    parser.show()
+    _app.processEvents()
+
+    def by_path():
+        image = QtGui.QImage(frame, 3840, 2160, QtGui.QImage.Format_RGBA8888)
+        image.save(path)
+        arg.write(path)
+
+        while qargparse._ImageLoader._running:
+            qargparse._ImageLoader._pool.waitForDone()
+            _app.processEvents()
+
+    def by_pixmap():
+        image = QtGui.QImage(frame, 3840, 2160, QtGui.QImage.Format_RGBA8888)
+        arg.write(QtGui.QPixmap.fromImage(image))
+
+    def by_array():
+        arg.write(frame)
+
+    for name, update, count in (("path", by_path, 5),
+                                ("QPixmap", by_pixmap, 20),
+                                ("NumPy array", by_array, 20)):
+        start = time.time()
+
+        for index in range(count):
+            frame[..., index % 3] = index * 10
+            update()
+            arg.widget().repaint()
+
+        sys.stdout.write("%-48s %8.1f fps\n" % (
+            "Update 4K preview, by %s.." % name,
+            count / (time.time() - start)
+        ))
+
+    parser.deleteLater()
+    _app.processEvents()
+    shutil.rmtree(tempdir)
+
+
+for interval in (0, 16):
+    arguments = [qargparse.Float("value%d" % index, max=500)
+                 for index in range(50)]
+    parser = qargparse.QArgumentParser(arguments)
+    parser.setChangeInterval(interval)
+    parser.show()
+    _app.processEvents()
+
+    counts = {"changing": 0, "changed": 0}
+
+    def on_change(arg, signal):
+        counts[signal] += 1
+        time.sleep(0.001)  # Such as a viewport being updated
+
+    parser.changing.connect(lambda arg: on_change(arg, "changing"))
+    parser.changed.connect(lambda arg: on_change(arg, "changed"))
+
+    slider = arguments[0]._slider
+    start = time.time()
+    slider.setSliderDown(True)
+
+    for value in range(500):
+        slider.setValue(value)
+        _app.processEvents()  # Events between steps of the drag
+
+    slider.setSliderDown(False)
+
+    while parser._throttle_timer.isActive():
+        _app.processEvents()
+
+    sys.stdout.write("%-48s %8.1f ms, %d changing, %d changed\n" % (
+        "Drag slider 500 steps, per %d msec.." % interval,
+        (time.time() - start) * 1000,
+        counts["changing"],
+        counts["changed"],
+    ))
+
+    parser.deleteLater()
+    _app.processEvents()
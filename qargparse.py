@@ -1,9 +1,20 @@
+import os
 import re
+import array
+import json
 import math
+import mmap
+import bisect
+import difflib
+import itertools
 import types
 import logging
+import sqlite3
+import hashlib
+import threading
 import platform
-from collections import OrderedDict as odict
+import tempfile
+from collections import OrderedDict as odict, deque
 
 # User-controlled, global resolution scale
 # Mostly for Mac which doesn't respect the Qt DPI scale
@@ -24,7 +35,9 @@ DefaultStyle = {
 __version__ = "0.6.0"
 _log = logging.getLogger(__name__)
 _type = type  # used as argument
-_dpi = None
+_dpi = {}  # Scale per screen, see `_screen_scale`
+_dpi_watched = set()  # Screens whose change of DPI is listened for
+_host_dpi = None  # Scale given by a host application, such as Maya
 _ismac = platform.system().lower() == "darwin"
 
 try:
@@ -33,6 +46,12 @@ try:
 except NameError:
     _basestring = str
 
+try:
+    _replace = os.replace
+except AttributeError:
+    # Python 2, atomic on POSIX only
+    _replace = os.rename
+
 from Qt import QtWidgets, QtCore, QtGui, QtCompat
 
 
@@ -80,48 +99,99 @@ QWidget #resetButton {
     padding-bottom: 10px;
 }
 
+QLabel[edited="true"],
+QCheckBox[edited="true"],
+QComboBox[edited="true"],
+QDoubleSpinBox[edited="true"],
+QSpinBox[edited="true"],
+*[edited="true"] QLabel,
+*[edited="true"] QCheckBox,
+*[edited="true"] QComboBox,
+*[edited="true"] QDoubleSpinBox,
+*[edited="true"] QSpinBox {
+    font-weight: bold;
+}
+
 """
 
 
-def px(value):
-    """Return a scaled value, for HDPI resolutions"""
+def _screen_scale(screen=None):
+    """Return DPI scale of `screen`, e.g. 1.5 or 2.0
+
+    Scales are computed once per screen, from the screen itself
+    rather than a window on it, and computed anew should its DPI
+    change at run-time.
+
+    Arguments:
+        screen (QScreen, optional): Defaults to the primary screen
+
+    """
 
-    global _dpi
+    global _host_dpi
 
-    if not _dpi:
+    if _host_dpi is None:
         try:
             # Autodesk Maya has a special utility
             # function this this occasion.
             from maya.OpenMayaUI import MQtUtil
-            _dpi = MQtUtil.dpiScale(1.0)
+            _host_dpi = MQtUtil.dpiScale(1.0)
 
         except ImportError:
-            pass
+            _host_dpi = 0
+
+    if _host_dpi:
+        return _host_dpi
+
+    if screen is None:
+        screen = QtGui.QGuiApplication.primaryScreen()
+
+    if screen is None:
+        # No application, or no screens, as of yet
+        return 1.0
+
+    name = screen.name()
+
+    try:
+        return _dpi[name]
+    except KeyError:
+        pass
 
-    if not _dpi:
-        # We can get system DPI from a window handle,
-        # but I haven't figured out how to get a window handle
-        # without first making a widget. So here we make one
-        # as invisibly as we can, as an invisible tooltip.
-        # This doesn't create a taskbar icon nor changes focus
-        # and in fact *should* happen without any noticeable effect
-        # to the user. Welcome to provide a less naughty alternative
-        any_widget = QtWidgets.QWidget()
-        any_widget.setWindowFlags(QtCore.Qt.ToolTip)
-        any_widget.show()
-        window = any_widget.windowHandle()
-        any_widget.deleteLater()
+    # Once per screen, rather than each time it is computed anew
+    if name not in _dpi_watched:
+        def forget(*args):
+            _dpi.pop(name, None)
 
-        # E.g. 1.5 or 2.0
-        scale = window.screen().logicalDotsPerInch() / 96.0
+        def unwatch(*args):
+            forget()
+            _dpi_watched.discard(name)  # Should it be plugged in again
 
-        # Store for later
-        _dpi = scale
+        screen.logicalDotsPerInchChanged.connect(forget)
+        screen.destroyed.connect(unwatch)
+        _dpi_watched.add(name)
 
-    return value * _dpi * ResolutionScale
+    _dpi[name] = screen.logicalDotsPerInch() / 96.0
 
+    return _dpi[name]
 
-def _scaled_stylesheet():
+
+def px(value, screen=None):
+    """Return a scaled value, for HDPI resolutions
+
+    Arguments:
+        value (int, float): Value at 96 DPI
+        screen (QScreen, optional): Scale for this screen,
+            defaults to the primary screen
+
+    """
+
+    return value * _screen_scale(screen) * ResolutionScale
+
+
+# Stylesheets already scaled, per DPI scale, see `_scaled_stylesheet`
+_stylesheets = {}
+
+
+def _scaled_stylesheet(screen=None):
     """Replace any mention of <num>px with scaled version
 
     This way, you can still use px without worrying about what
@@ -129,15 +199,327 @@ def _scaled_stylesheet():
 
     """
 
+    scale = px(1, screen)
+
+    try:
+        return _stylesheets[scale]
+    except KeyError:
+        pass
+
     output = []
     for line in _stylesheet.splitlines():
         line = line.rstrip()
         if line.endswith("px;"):
             key, value = line.rsplit(" ", 1)
-            value = px(int(value[:-3]))
+            value = px(int(value[:-3]), screen)
             line = "%s %dpx;" % (key, value)
         output += [line]
-    return "\n".join(output)
+
+    stylesheet = "\n".join(output)
+    _stylesheets[scale] = stylesheet
+
+    return stylesheet
+
+
+def _repolish(widget):
+    """Apply stylesheet to `widget` and its children anew
+
+    Qt doesn't re-evaluate selectors matching on dynamic properties
+    once a widget has been polished, so this is called when a property
+    such as "edited" changes.
+
+    """
+
+    for child in [widget] + widget.findChildren(QtWidgets.QWidget):
+        style = child.style()
+        style.unpolish(child)
+        style.polish(child)
+
+
+# Decoded `_reset_icon`, per scaled size, see `_reset_icon_cached`
+_reset_icons = {}
+
+
+def _reset_icon_cached(screen=None):
+    """Return the reset icon, decoded once per process and DPI scale"""
+    size = px(12, screen)
+
+    try:
+        return _reset_icons[size]
+    except KeyError:
+        pass
+
+    data = QtCore.QByteArray.fromBase64(_reset_icon)
+    pixmap = QtGui.QPixmap()
+    pixmap.loadFromData(data)
+
+    icon = QtGui.QIcon(pixmap)
+    _reset_icons.clear()  # Any previous scale is no longer relevant
+    _reset_icons[size] = icon
+
+    return icon
+
+
+def _save(storage, pending, stored):
+    """Write `pending` values to `storage`, unless already `stored`"""
+    changed = dict(
+        (name, value)
+        for name, value in pending.items()
+        if name not in stored or stored[name] != value
+    )
+
+    pending.clear()
+
+    if changed and not storage.readonly:
+        storage.save_many(changed)
+        stored.update(changed)
+
+
+class Storage(object):
+    """Persistence of values, by name
+
+    Values are passed as encoded by each argument, see `QArgument.encode()`,
+    and are read and written many at a time.
+
+    """
+
+    readonly = False
+
+    def fileName(self):
+        return ""
+
+    def load_all(self):
+        """Return every stored value, as a mapping of name and value"""
+        raise NotImplementedError
+
+    def save_many(self, values):
+        """Store each value of dictionary `values`, replacing any prior"""
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    # Optional Qt syntax
+    loadAll = load_all
+    saveMany = save_many
+
+
+class QSettingsStorage(Storage):
+    """Persistence by QSettings, whose values may come back as strings"""
+
+    def __init__(self, settings):
+        self._settings = settings
+
+    def fileName(self):
+        return self._settings.fileName()
+
+    def load_all(self):
+        settings = self._settings
+        return dict(
+            (key, settings.value(key))
+            for key in settings.allKeys()
+        )
+
+    def save_many(self, values):
+        for name, value in values.items():
+            self._settings.setValue(name, value)
+
+        self._settings.sync()
+
+    def clear(self):
+        self._settings.clear()
+
+
+class JsonStorage(Storage):
+    """Persistence by a JSON file, preserving types of values
+
+    The file is read once, and written as a whole to a temporary
+    file in the same directory which then replaces the original,
+    such that it is never left half-written.
+
+    """
+
+    def __init__(self, fname):
+        self._fname = fname
+        self._values = None
+
+    def fileName(self):
+        return self._fname
+
+    def load_all(self):
+        if self._values is None:
+            try:
+                with open(self._fname) as f:
+                    self._values = json.load(f)
+            except (IOError, OSError):
+                self._values = {}
+            except ValueError:
+                _log.warning("Ignoring malformed settings @ %s" % self._fname)
+                self._values = {}
+
+        return dict(self._values)
+
+    def save_many(self, values):
+        self.load_all()
+        self._values.update(values)
+        self._dump()
+
+    def clear(self):
+        self._values = {}
+        self._dump()
+
+    def _dump(self):
+        dirname = os.path.dirname(os.path.abspath(self._fname))
+
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+
+        fd, tmp = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._values, f, indent=2, sort_keys=True)
+            _replace(tmp, self._fname)
+
+        except Exception:
+            os.remove(tmp)
+            raise
+
+
+class SqliteStorage(Storage):
+    """Persistence by a SQLite database, shared by many parsers
+
+    Values are stored as JSON per name, in rows keyed by `namespace`,
+    such that each parser writes only what has changed.
+
+    """
+
+    def __init__(self, fname, namespace="QArgparse"):
+        self._fname = fname
+        self._namespace = namespace
+        self._db = sqlite3.connect(fname)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS arguments ("
+            "namespace TEXT, name TEXT, value TEXT, "
+            "PRIMARY KEY (namespace, name))"
+        )
+
+    def fileName(self):
+        return self._fname
+
+    def load_all(self):
+        rows = self._db.execute(
+            "SELECT name, value FROM arguments WHERE namespace = ?",
+            (self._namespace,)
+        )
+
+        return dict((name, json.loads(value)) for name, value in rows)
+
+    def save_many(self, values):
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO arguments VALUES (?, ?, ?)",
+                [
+                    (self._namespace, name, json.dumps(value))
+                    for name, value in values.items()
+                ]
+            )
+
+    def clear(self):
+        with self._db:
+            self._db.execute(
+                "DELETE FROM arguments WHERE namespace = ?",
+                (self._namespace,)
+            )
+
+
+class SnapshotStorage(Storage):
+    """Read-only values of a file written by `SnapshotStorage.write()`
+
+    The file is memory-mapped, and only the values of arguments
+    actually added to a parser are decoded. Use this to launch with
+    values captured elsewhere, such as from a `JsonStorage`.
+
+    Example:
+        >>> SnapshotStorage.write("snapshot.bin", {"age": 33})
+        >>> parser = QArgumentParser(storage=SnapshotStorage("snapshot.bin"))
+
+    """
+
+    readonly = True
+
+    def __init__(self, fname):
+        self._fname = fname
+
+    def fileName(self):
+        return self._fname
+
+    @staticmethod
+    def write(fname, values):
+        """Write a snapshot of dictionary `values` to `fname`
+
+        The file is an index of name to offset and length of each
+        value, on the first line, followed by each value as JSON.
+
+        """
+
+        blobs = []
+        index = {}
+        offset = 0
+
+        for name, value in values.items():
+            blob = json.dumps(value).encode("utf-8")
+            index[name] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+
+        with open(fname, "wb") as f:
+            f.write(json.dumps(index).encode("utf-8") + b"\n")
+            f.write(b"".join(blobs))
+
+    def load_all(self):
+        return _Snapshot(self._fname)
+
+    def save_many(self, values):
+        raise TypeError("%s is read-only" % self._fname)
+
+    def clear(self):
+        raise TypeError("%s is read-only" % self._fname)
+
+
+class _Snapshot(object):
+    """Decode values of a snapshot on first access, by name"""
+
+    def __init__(self, fname):
+        self._index = {}
+        self._data = b""
+
+        try:
+            with open(fname, "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    self._data = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+        except (IOError, OSError):
+            return
+
+        header = self._data.find(b"\n") + 1
+        self._index = json.loads(self._data[:header].decode("utf-8") or "{}")
+        self._start = header
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __getitem__(self, name):
+        offset, length = self._index[name]
+        offset += self._start
+        return json.loads(self._data[offset:offset + length].decode("utf-8"))
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
 
 
 DoNothing = None
@@ -149,14 +531,25 @@ class QArgumentParser(QtWidgets.QWidget):
     Arguments:
         arguments (list, optional): Instances of QArgument
         description (str, optional): Long-form text of what this parser is for
-        storage (QSettings, optional): Persistence to disk, providing
-            value() and setValue() methods
+        storage (Storage, optional): Persistence to disk, such as
+            `JsonStorage`, or an instance of QSettings. Edited values are
+            written back once edits have settled, see `setStorageDelay()`
         style (dict, optional): User-specified overrides to style choices
+        virtual (bool, optional): Only create widgets for arguments
+            scrolled into view, for parsers with many arguments
         parent (QWidget, optional): Parent of this widget
 
+    Signals:
+        changed: An argument was changed, once committed
+        changing: An argument is being changed, such as by a slider
+            being dragged, followed by `changed` once released
+
+    Either may be limited to once per interval, see `setChangeInterval()`
+
     """
 
     changed = QtCore.Signal(QtCore.QObject)  # A QArgument
+    changing = QtCore.Signal(QtCore.QObject)
     entered = QtCore.Signal(QtCore.QObject)
     exited = QtCore.Signal(QtCore.QObject)
 
@@ -169,6 +562,7 @@ class QArgumentParser(QtWidgets.QWidget):
                  description=None,
                  storage=None,
                  style=None,
+                 virtual=False,
                  parent=None):
         super(QArgumentParser, self).__init__(parent)
         self.setAttribute(QtCore.Qt.WA_StyledBackground)
@@ -181,14 +575,17 @@ class QArgumentParser(QtWidgets.QWidget):
                 __name__, "QArgparse",
             )
 
+        if isinstance(storage, QtCore.QSettings):
+            storage = QSettingsStorage(storage)
+
         if storage is not None:
             _log.info("Storing settings @ %s" % storage.fileName())
 
         arguments = arguments or []
 
         assert hasattr(arguments, "__iter__"), "arguments must be iterable"
-        assert isinstance(storage, (type(None), QtCore.QSettings)), (
-            "storage must be of type QSettings"
+        assert isinstance(storage, (type(None), Storage)), (
+            "storage must be of type Storage or QSettings"
         )
 
         layout = QtWidgets.QGridLayout(self)
@@ -219,20 +616,113 @@ class QArgumentParser(QtWidgets.QWidget):
 
         self._row = 1
         self._storage = storage
+
+        # Values edited since last written to storage, and those
+        # known to be in storage already, to only write actual changes
+        self._pending = dict()
+        self._stored = dict()
+
+        # Read once on first argument added, rather than once per argument
+        self._loaded = None
+
+        self._storage_timer = QtCore.QTimer(self)
+        self._storage_timer.setSingleShot(True)
+        self._storage_timer.setInterval(500)
+        self._storage_timer.timeout.connect(self.flush)
+
+        # Changes made within an interval of the last, emitted at its end
+        self._throttled = odict()
+        self._throttle_timer = QtCore.QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(0)
+        self._throttle_timer.timeout.connect(self._onThrottled)
+
+        if storage is not None:
+            pending, stored = self._pending, self._stored
+
+            # Without reference to self, which is gone by then
+            self.destroyed.connect(
+                lambda *args: _save(storage, pending, stored)
+            )
         self._arguments = odict()
         self._resets = dict()
+        self._rows = dict()
+
+        # Which arguments each condition read from, and the reverse
+        self._inputs = dict()
+        self._dependents = dict()
+
+        # Arguments whose condition was assigned after being added
+        self._stale = set()
         self._description = description
         self._icon = icon
         self._style = style or DefaultStyle
 
-        for arg in arguments or []:
-            self._addArgument(arg)
+        # Screen this parser is scaled for, None being the primary screen
+        self._screen = None
+        self._window = None
+
+        # Rows of a virtual parser, in a scroll area of their own
+        self._virtual = None
+
+        if virtual:
+            scroll = QtWidgets.QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
+
+            self._virtual = _VirtualRows(self, scroll)
+            scroll.setWidget(self._virtual)
+
+            layout.addWidget(scroll, 1, 0, 1, 3)
+            layout.setRowStretch(1, 1)
+
+        self.addArguments(arguments)
 
         # Prevent getting squashed on the vertical
         self.setSizePolicy(QtWidgets.QSizePolicy.Preferred,
                            QtWidgets.QSizePolicy.MinimumExpanding)
 
-        self.setStyleSheet(_scaled_stylesheet())
+        self._applyScale()
+
+    def showEvent(self, event):
+        # Follow the window onto whichever screen it is moved to
+        window = self.window().windowHandle()
+
+        if window is not None and window is not self._window:
+            previous, self._window = self._window, window
+
+            if previous is not None:
+                try:
+                    previous.screenChanged.disconnect(self._applyScale)
+                except (RuntimeError, TypeError):
+                    pass  # Deleted alongside its widget
+
+            window.screenChanged.connect(self._applyScale)
+
+            if window.screen() is not QtGui.QGuiApplication.primaryScreen():
+                self._applyScale(window.screen())
+
+        super(QArgumentParser, self).showEvent(event)
+
+    def _applyScale(self, screen=None):
+        """Scale spacing, stylesheet and reset buttons for `screen`"""
+        self._screen = screen
+
+        layout = self.layout()
+
+        # Packed tightly on the vertical
+        layout.setHorizontalSpacing(px(10, screen))
+        layout.setVerticalSpacing(px(2, screen))
+
+        # Reset buttons are created on demand, keep room for them
+        layout.setColumnMinimumWidth(2, px(12, screen))
+
+        for reset in self._resets.values():
+            reset.parent().setFixedSize(px(12, screen), px(12, screen))
+            reset.setIcon(_reset_icon_cached(screen))
+            reset.setIconSize(QtCore.QSize(px(12, screen), px(12, screen)))
+
+        self.setStyleSheet(_scaled_stylesheet(screen))
 
     def mouseReleaseEvent(self, event):
         widget = self.childAt(event.pos())
@@ -291,57 +781,99 @@ class QArgumentParser(QtWidgets.QWidget):
         self._addArgument(arg)
         return arg
 
-    def _addArgument(self, arg):
+    def addArguments(self, arguments):
+        """Add many instances of QArgument at once
+
+        Widgets for every argument are created first, followed by
+        a single pass over conditions and edited-state, rather than
+        one such pass per argument added.
+
+        Arguments:
+            arguments (list): Instances of QArgument
+
+        Returns:
+            list: The arguments added
+
+        """
+
+        arguments = list(arguments)
+
+        # Hold off on repainting until every row is in place
+        self.setUpdatesEnabled(False)
+
+        try:
+            for arg in arguments:
+                self._addArgument(arg, deferred=True)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._refresh(arguments)
+        return arguments
+
+    def _addArgument(self, arg, deferred=False):
         if arg["name"] in self._arguments:
             raise ValueError("Duplicate argument '%s'" % arg["name"])
 
-        if self._storage is not None:
-            default = self._storage.value(arg["name"])
-
-            # Qt's native storage doesn't handle booleans
-            # in either of the Python bindings, so we need
-            # some jujitsu here to translate values it gives
-            # us into something useful to Python
-            if default:
-                if isinstance(arg, Boolean):
-                    default = bool({
-                        None: QtCore.Qt.Unchecked,
-
-                        0: QtCore.Qt.Unchecked,
-                        1: QtCore.Qt.Checked,
-                        2: QtCore.Qt.Checked,
-
-                        "0": QtCore.Qt.Unchecked,
-                        "1": QtCore.Qt.Checked,
-                        "2": QtCore.Qt.Checked,
-
-                        # May be stored as string, if used with IniFormat
-                        "false": QtCore.Qt.Unchecked,
-                        "true": QtCore.Qt.Checked,
-                    }.get(default))
-
-                if isinstance(arg, Number):
-                    if isinstance(arg, Float):
-                        default = float(default)
-                    else:
-                        default = int(default)
-
-                arg["default"] = default
+        if self._loaded is None:
+            storage = self._storage
+            self._loaded = storage.load_all() if storage is not None else {}
 
-        # Argument label and editor widget
-        label = _with_entered_exited2(QtWidgets.QLabel)(arg["label"])
+        value = self._loaded.get(arg["name"])
+
+        if value is not None:
+            try:
+                arg["initial"] = arg.decode(value)
+            except ValueError:
+                _log.warning(
+                    "Ignoring stored value %r of '%s'" % (value, arg["name"])
+                )
+            else:
+                self._stored[arg["name"]] = arg.encode(arg["initial"])
 
-        # Take condition into account
-        if arg["condition"]:
-            arg["enabled"] = arg["condition"]()
+        # Internal
+        arg["_widget"] = None  # Created on add, or once scrolled into view
+        arg["_reset"] = None  # Created on first edit
+
+        # Signals
+        arg.changed.connect(lambda: self.on_changed(arg))
+        arg.changing.connect(lambda: self.on_changing(arg))
+        arg.entered.connect(lambda: self.on_entered(arg))
+        arg.exited.connect(lambda: self.on_exited(arg))
+
+        # Take ownership for clean deletion alongside parser
+        arg.setParent(self)
+
+        self._arguments[arg["name"]] = arg
 
-        if isinstance(arg, Enum):
-            widget = arg.create(fillWidth=self._style["comboboxFillWidth"])
+        if self._virtual is not None:
+            self._virtual.addArgument(arg)
         else:
-            widget = arg.create()
+            self._addRow(arg)
+
+        # Establish initial state, taking "initial" value into account
+        if not deferred:
+            self._refresh([arg])
+
+    def _createWidget(self, arg):
+        """Create the editor of `arg`, reflecting its current state"""
+
+        # Establishing initial values isn't a change
+        arg.blockSignals(True)
+
+        try:
+            if isinstance(arg, Enum):
+                widget = arg.create(
+                    fillWidth=self._style["comboboxFillWidth"]
+                )
+            else:
+                widget = arg.create()
+
+            arg._attach()
+
+        finally:
+            arg.blockSignals(False)
 
         if self._style.get("useTooltip"):
-            label.setToolTip(arg["help"])
             widget.setToolTip(arg["help"])
 
         widget.setObjectName(arg["name"])  # useful in CSS
@@ -349,26 +881,21 @@ class QArgumentParser(QtWidgets.QWidget):
         widget.setEnabled(arg["enabled"])
         widget.setProperty("type", type(arg).__name__)
 
-        def base64_to_pixmap(base64):
-            data = QtCore.QByteArray.fromBase64(base64)
-            pixmap = QtGui.QPixmap()
-            pixmap.loadFromData(data)
-            return pixmap
-
-        # Reset btn widget
-        reset_icon = QtGui.QIcon(base64_to_pixmap(_reset_icon))
-        reset_container = QtWidgets.QWidget()
-        reset_container.setFixedSize(px(12), px(12))
-        reset = QtWidgets.QPushButton("")  # default
-        reset.setObjectName("resetButton")
-        reset.setIcon(reset_icon)
-        reset.setIconSize(QtCore.QSize(px(12), px(12)))
-        reset.setToolTip(arg.compose_reset_tip())
-        reset.hide()  # shown on edit
+        # Edited whilst out of view, in a virtual parser
+        if arg["edited"]:
+            widget.setProperty("edited", True)
 
-        # Internal
         arg["_widget"] = widget
-        arg["_reset"] = reset
+
+        return widget
+
+    def _addRow(self, arg):
+        # Argument label and editor widget
+        label = _with_entered_exited2(QtWidgets.QLabel)(arg["label"])
+        widget = self._createWidget(arg)
+
+        if self._style.get("useTooltip"):
+            label.setToolTip(arg["help"])
 
         # Align label on top of row if widget is over two times higher
         height = (lambda w: w.sizeHint().height())
@@ -379,11 +906,6 @@ class QArgumentParser(QtWidgets.QWidget):
         else:
             alignment = (QtCore.Qt.AlignRight,)
 
-        # Layout
-        layout = QtWidgets.QVBoxLayout(reset_container)
-        layout.addWidget(reset)
-        layout.setContentsMargins(0, 0, 0, 0)
-
         layout = self.layout()
 
         #  ___________________________________________
@@ -397,83 +919,253 @@ class QArgumentParser(QtWidgets.QWidget):
             layout.addWidget(label, self._row, 0, *alignment)
 
         layout.addWidget(widget, self._row, 1)
-        layout.addWidget(reset_container, self._row, 2, *alignment)
-
-        # Packed tightly on the vertical
-        layout.setHorizontalSpacing(px(10))
-        layout.setVerticalSpacing(px(2))
-
-        # Signals
-        def _reset():
-            arg.write(arg["default"])
 
-            # Prevent button from getting stuck in down-state, since
-            # it is hidden right after having been pressed
-            reset.setDown(False)
-
-        reset.pressed.connect(_reset)
-
-        arg.changed.connect(lambda: self.on_changed(arg))
-        arg.entered.connect(lambda: self.on_entered(arg))
-        arg.exited.connect(lambda: self.on_exited(arg))
         label.entered.connect(lambda: self.on_entered(arg))
         label.exited.connect(lambda: self.on_exited(arg))
 
-        # Take ownership for clean deletion alongside parser
-        arg.setParent(self)
-
         def setVisible(value):
+            arg["visible"] = value
             label.setVisible(value)
             widget.setVisible(value)
-            reset_container.setVisible(value)
+
+            if arg["_reset"] is not None:
+                arg["_reset"].parent().setVisible(value)
 
         arg.setVisible = setVisible
 
         if not arg["visible"]:
             arg.setVisible(False)
 
+        self._rows[arg["name"]] = (self._row, alignment)
         self._row += 1
-        self._arguments[arg["name"]] = arg
-        self._resets[arg["name"]] = reset
 
-        # Establish initial state, taking "initial" value into account
-        self.on_changed(arg)
+    def _refresh(self, arguments):
+        """Establish initial state of newly added `arguments`"""
+
+        # Conditions of, or reading from, any of the new arguments
+        names = set()
+        for arg in arguments:
+            if arg["condition"]:
+                names.add(arg["name"])
+            names.update(self._dependents.get(arg["name"], ()))
+
+        self._updateConditions(names)
+
+        for arg in arguments:
+            self._updateEdited(arg)
+
+            if arg["_widget"] is not None:
+                arg["_widget"].setEnabled(arg["enabled"])
+
+            self.changed.emit(arg)
 
     def clear(self):
         assert self._storage, "Cannot clear without persistent storage"
+        self._pending.clear()
+        self._stored.clear()
+        self._loaded = None
         self._storage.clear()
         _log.info("Clearing settings @ %s" % self._storage.fileName())
 
     def find(self, name):
         return self._arguments[name]
 
+    def setStorageDelay(self, msec):
+        """Write edits to storage once none have been made for `msec`"""
+        self._storage_timer.setInterval(msec)
+
+    def setChangeInterval(self, msec):
+        """Handle changes of each argument at most once per `msec`
+
+        A change made within `msec` of the last is handled at the end of
+        that interval, together with any other made meanwhile, of which
+        only the latest per argument is handled. Handling a committed
+        change includes restyling its argument, evaluating conditions
+        reading from it and emitting `changed`.
+
+        Defaults to 0, handling every change as it is made.
+
+        """
+
+        self._throttle_timer.setInterval(msec)
+
+    def flush(self):
+        """Write edited values to storage now, rather than once settled
+
+        Only values that differ from what is already stored are written.
+        This also happens as the parser is destroyed.
+
+        """
+
+        self._storage_timer.stop()
+
+        if self._storage is not None:
+            _save(self._storage, self._pending, self._stored)
+
+    def _addReset(self, arg):
+        """Create the reset button of `arg`, on its first edit"""
+        size = px(12, self._screen)
+
+        # Parented right away, lest it be shown as a window of its own
+        container = QtWidgets.QWidget(self)
+        container.setFixedSize(size, size)
+
+        reset = QtWidgets.QPushButton("", container)
+        reset.setObjectName("resetButton")
+        reset.setIcon(_reset_icon_cached(self._screen))
+        reset.setIconSize(QtCore.QSize(size, size))
+        reset.setToolTip(arg.compose_reset_tip())
+        reset.setEnabled(bool(arg["enabled"]))
+
+        layout = QtWidgets.QVBoxLayout(container)
+        layout.addWidget(reset)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        row, alignment = self._rows[arg["name"]]
+        self.layout().addWidget(container, row, 2, *alignment)
+        container.setVisible(arg["visible"])
+
+        def _reset():
+            arg.write(arg["default"])
+
+            # Prevent button from getting stuck in down-state, since
+            # it is hidden right after having been pressed
+            reset.setDown(False)
+
+        reset.pressed.connect(_reset)
+
+        arg["_reset"] = reset
+        self._resets[arg["name"]] = reset
+
+        return reset
+
+    def _updateEdited(self, arg):
+        """Reflect whether `arg` differs from its default"""
+        edited = arg.isEdited()
+        visible = edited and arg["enabled"] and arg["editable"]
+
+        reset = self._resets.get(arg["name"])
+
+        # Virtual parsers provide a reset button per row in view
+        if reset is None and visible and self._virtual is None:
+            reset = self._addReset(arg)
+
+        if reset is not None:
+            reset.setVisible(visible)
+
+        # Restyling is expensive, only do it when state actually changes
+        if edited == arg["edited"]:
+            return
+
+        arg["edited"] = edited
+
+        if arg["_widget"] is None:
+            return  # Applied once created, see `_createWidget`
+
+        # Styled by the parser stylesheet, via *[edited="true"]
+        arg["_widget"].setProperty("edited", edited)
+        _repolish(arg["_widget"])
+
+    def refreshConditions(self):
+        """Evaluate the condition of every argument
+
+        Conditions are otherwise only evaluated when an argument they
+        read from changes. Call this when a condition depends on state
+        outside of this parser, such as the scene of a host application.
+
+        """
+
+        self._updateConditions(self._arguments)
+
+    def _updateConditions(self, names):
+        names = self._stale.union(names)
+        self._stale.clear()
+
+        for name in names:
+            other = self._arguments.get(name)
+
+            if other is not None:
+                self._evaluateCondition(other)
+
+    def _evaluateCondition(self, arg):
+        """Evaluate the condition of `arg`, recording what it reads"""
+        name = arg["name"]
+
+        for other in self._inputs.pop(name, ()):
+            self._dependents[other].discard(name)
+
+        if not arg["condition"]:
+            return
+
+        enabled, inputs = _evaluate(arg["condition"])
+
+        for other in inputs:
+            self._dependents.setdefault(other, set()).add(name)
+
+        self._inputs[name] = inputs
+
+        arg["enabled"] = enabled
+
+        if arg["_widget"] is not None:
+            arg["_widget"].setEnabled(enabled)
+
+        if arg["_reset"] is not None:
+            arg["_reset"].setEnabled(enabled)
+
+    def _invalidateCondition(self, arg):
+        """The condition of `arg` was replaced, evaluate it on next change"""
+        if arg["name"] in self._arguments:
+            self._stale.add(arg["name"])
+
     def on_changed(self, arg):
-        reset = self._resets[arg["name"]]
-        reset.setVisible(arg.isEdited() and arg["enabled"] and arg["editable"])
+        if self._storage is not None and arg["editable"]:
+            value = arg.read()
 
-        arg["edited"] = arg.isEdited()
+            if value is not None:
+                self._pending[arg["name"]] = arg.encode(value)
+                self._storage_timer.start()  # Restarted on every edit
 
-        if arg["edited"]:
-            arg["_widget"].setStyleSheet("""\
-                QLabel,
-                QCheckBox,
-                QComboBox,
-                QDoubleSpinBox,
-                QSpinBox {
-                    font-weight: bold
-                }
-            """)
-        else:
-            arg["_widget"].setStyleSheet(None)
+        self._throttle("changed", arg)
+
+    def on_changing(self, arg):
+        self._throttle("changing", arg)
+
+    def _throttle(self, signal, arg):
+        """Handle `signal` of `arg` now, or at the end of this interval"""
+        if not self._throttle_timer.interval():
+            return self._handle(signal, arg)
+
+        if self._throttle_timer.isActive():
+            # Handled in order of their latest change
+            key = (signal, arg["name"])
+            self._throttled.pop(key, None)
+            self._throttled[key] = arg
+            return
+
+        self._handle(signal, arg)
+        self._throttle_timer.start()
+
+    def _onThrottled(self):
+        throttled, self._throttled = self._throttled, odict()
+
+        for (signal, name), arg in throttled.items():
+            self._handle(signal, arg)
+
+        # Any change until the end of the next interval is throttled, too
+        if throttled:
+            self._throttle_timer.start()
 
-        # Conditions may have changed
-        for other in self._arguments.values():
-            if other["condition"]:
-                other["enabled"] = other["condition"]()
-                other["_widget"].setEnabled(other["enabled"])
-                other["_reset"].setEnabled(other["enabled"])
+    def _handle(self, signal, arg):
+        if signal == "changing":
+            return self.changing.emit(arg)
 
-        arg["_widget"].setEnabled(arg["enabled"])
+        self._updateEdited(arg)
+
+        # Conditions reading from this argument may have changed
+        self._updateConditions(self._dependents.get(arg["name"], ()))
+
+        if arg["_widget"] is not None:
+            arg["_widget"].setEnabled(arg["enabled"])
 
         self.changed.emit(arg)
 
@@ -487,12 +1179,348 @@ class QArgumentParser(QtWidgets.QWidget):
 
     # Optional PEP08 syntax
     add_argument = addArgument
+    add_arguments = addArguments
+
+
+class _VirtualRow(QtWidgets.QWidget):
+    """Label, editor and reset button of one row in a virtual parser
+
+    Rows are re-used for whichever argument is scrolled into view,
+    with only the editor being created anew for each argument.
+
+    """
+
+    def __init__(self, parser, parent=None):
+        super(_VirtualRow, self).__init__(parent)
+
+        label = _with_entered_exited2(QtWidgets.QLabel)()
+        label.entered.connect(self.on_entered)
+        label.exited.connect(self.on_exited)
+
+        reset_container = QtWidgets.QWidget()
+        reset = QtWidgets.QPushButton("", reset_container)
+        reset.setObjectName("resetButton")
+        reset.pressed.connect(self.on_reset)
+        reset.hide()  # shown on edit
+
+        layout = QtWidgets.QVBoxLayout(reset_container)
+        layout.addWidget(reset)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.addWidget(label)
+        layout.addWidget(reset_container)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._parser = parser
+        self._label = label
+        self._reset = reset
+        self._reset_container = reset_container
+        self._arg = None
+
+    def bind(self, arg, label_width):
+        """Show `arg` in this row, creating its editor"""
+        parser = self._parser
+        screen = parser._screen
+        size = px(12, screen)
+
+        widget = parser._createWidget(arg)
+
+        label = self._label
+        label.setText("" if isinstance(arg, Boolean) else arg["label"])
+        label.setToolTip(
+            arg["help"] if parser._style.get("useTooltip") else ""
+        )
+        label.setFixedWidth(label_width)
+
+        # Align label on top of row if widget is over two times higher
+        height = (lambda w: w.sizeHint().height())
+        label_on_top = height(label) * 2 < height(widget)
+
+        if label_on_top:
+            alignment = QtCore.Qt.AlignRight | QtCore.Qt.AlignTop
+        else:
+            alignment = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+
+        label.setAlignment(alignment)
+
+        reset = self._reset
+        reset.setIcon(_reset_icon_cached(screen))
+        reset.setIconSize(QtCore.QSize(size, size))
+        reset.setToolTip(arg.compose_reset_tip())
+        reset.setEnabled(bool(arg["enabled"]))
+        self._reset_container.setFixedSize(size, size)
+
+        layout = self.layout()
+        layout.setSpacing(parser.layout().horizontalSpacing())
+        layout.insertWidget(1, widget, 1)
+
+        arg["_reset"] = reset
+        parser._resets[arg["name"]] = reset
+        self._arg = arg
+
+        reset.setVisible(
+            arg["edited"] and bool(arg["enabled"]) and arg["editable"]
+        )
+
+        self.show()
+
+    def release(self):
+        """Give up the editor of the current argument, keeping its value"""
+        arg, self._arg = self._arg, None
+        widget = arg["_widget"]
+
+        arg._detach()
+        arg["_reset"] = None
+        self._parser._resets.pop(arg["name"], None)
+
+        self.layout().removeWidget(widget)
+        widget.hide()
+        widget.deleteLater()
+
+        self._reset.hide()
+        self.hide()
+
+    def on_entered(self):
+        if self._arg is not None:
+            self._parser.on_entered(self._arg)
+
+    def on_exited(self):
+        if self._arg is not None:
+            self._parser.on_exited(self._arg)
+
+    def on_reset(self):
+        if self._arg is not None:
+            self._arg.write(self._arg["default"])
+
+        # Prevent button from getting stuck in down-state, since
+        # it is hidden right after having been pressed
+        self._reset.setDown(False)
+
+
+class _VirtualRows(QtWidgets.QWidget):
+    """Rows of a virtual QArgumentParser, within `scroll`
+
+    Only rows within, or close to, the visible part of `scroll` are
+    given widgets. Height of a row is estimated per argument type,
+    until a row of that type has been shown and measured.
+
+    """
+
+    # Rows are created this far outside of the visible area, in pixels
+    margin = 200
+
+    def __init__(self, parser, scroll):
+        super(_VirtualRows, self).__init__()
+
+        self._parser = parser
+        self._scroll = scroll
+
+        self._arguments = []  # In order of rows
+        self._heights = []  # Per row, measured or estimated
+        self._offsets = [0]  # Top of each row, and bottom of the last
+        self._estimates = {}  # Row height, per argument type
+        self._bound = {}  # Row index to _VirtualRow
+        self._pool = []  # Rows scrolled out of view, for re-use
+        self._label_width = 0
+        self._pending = False
+
+        scroll.verticalScrollBar().valueChanged.connect(self.schedule)
+
+    def addArgument(self, arg):
+        metrics = self.fontMetrics()
+        width = getattr(metrics, "horizontalAdvance", metrics.width)
+        self._label_width = max(self._label_width, width(arg["label"]))
+
+        def setVisible(value):
+            arg["visible"] = value
+            self._layout()
+
+        arg.setVisible = setVisible
+
+        self._arguments.append(arg)
+        self._heights.append(self._estimate(arg))
+        self._offsets.append(self._offsets[-1] + self._extent(-1))
+        self.setMinimumHeight(self._offsets[-1])
+        self.schedule()
+
+    def _estimate(self, arg):
+        return self._estimates.get(type(arg), px(22, self._parser._screen))
+
+    def _extent(self, index):
+        """Return height of row at `index` and spacing below it"""
+        if not self._arguments[index]["visible"]:
+            return 0
+
+        spacing = self._parser.layout().verticalSpacing()
+        return self._heights[index] + spacing
+
+    def schedule(self, *args):
+        """Update rows on next event loop, coalescing many requests"""
+        if not self._pending:
+            self._pending = True
+            QtCore.QTimer.singleShot(0, self.update_rows)
+
+    def resizeEvent(self, event):
+        super(_VirtualRows, self).resizeEvent(event)
+
+        for index, row in self._bound.items():
+            row.setGeometry(self._geometry(index))
+
+        self.schedule()
+
+    def _geometry(self, index):
+        return QtCore.QRect(
+            0, self._offsets[index], self.width(), self._heights[index]
+        )
+
+    def _layout(self):
+        """Compute offset of every row, from their heights"""
+        offsets = [0]
+
+        for index in range(len(self._arguments)):
+            offsets.append(offsets[-1] + self._extent(index))
+
+        self._offsets = offsets
+        self.setMinimumHeight(offsets[-1])
+
+        for index, row in self._bound.items():
+            row.setGeometry(self._geometry(index))
+
+        self.schedule()
+
+    def update_rows(self):
+        """Create rows in view, and release those scrolled out of view"""
+        self._pending = False
+
+        viewport = self._scroll.viewport()
+        top = self._scroll.verticalScrollBar().value() - self.margin
+        bottom = top + viewport.height() + self.margin * 2
+
+        first = max(0, bisect.bisect_right(self._offsets, top) - 1)
+        last = min(len(self._arguments),
+                   bisect.bisect_left(self._offsets, bottom))
+
+        wanted = set(
+            index for index in range(first, last)
+            if self._arguments[index]["visible"]
+        )
+
+        for index in list(self._bound):
+            if index not in wanted:
+                row = self._bound.pop(index)
+                row.release()
+                self._pool.append(row)
+
+        measured = False
+        for index in sorted(wanted):
+            if index in self._bound:
+                continue
+
+            row = self._pool.pop() if self._pool else _VirtualRow(
+                self._parser, self
+            )
+
+            arg = self._arguments[index]
+            row.bind(arg, self._label_width)
+            self._bound[index] = row
+
+            height = row.sizeHint().height()
+            self._estimates.setdefault(type(arg), height)
+
+            if height != self._heights[index]:
+                self._heights[index] = height
+                measured = True
+
+            row.setGeometry(self._geometry(index))
+
+        if measured:
+            # Heights differ from their estimates, which may
+            # have brought additional rows into view
+            self._layout()
+
+
+class _ArgumentData(object):
+    """State of a QArgument, with the interface of a dict
+
+    Keys common to every argument are stored in slots, rather than
+    a dict per argument. Any other key, such as those of subclasses
+    or users, go into a dict of their own, created on first use.
+
+    """
+
+    __slots__ = (
+        "name",
+        "label",
+        "default",
+        "initial",
+        "help",
+        "read",
+        "write",
+        "items",
+        "min",
+        "max",
+        "enabled",
+        "editable",
+        "edited",
+        "condition",
+        "placeholder",
+        "visible",
+        "stepsize",
+        "current",
+        "_widget",
+        "_reset",
+        "_extra",
+    )
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            return _extra(self, key)
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+
+        except AttributeError:
+            # Not one of the slots above
+            try:
+                self._extra[key] = value
+            except AttributeError:
+                self._extra = {key: value}
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+
+def _extra(data, key):
+    """Return `key` of `data` not held in a slot, see `_ArgumentData`"""
+    try:
+        return data._extra[key]
+    except AttributeError:
+        raise KeyError(key)
 
 
 class QArgument(QtCore.QObject):
-    """Base class of argument user interface"""
+    """Base class of argument user interface
+
+    Arguments hold on to their value until `create()` is called,
+    such that they may be read, written and compared against their
+    default without a widget, or even a QApplication.
+
+    Values being edited, such as by dragging a slider, emit `changing`
+    and emit `changed` once committed, such as once the slider is
+    released.
+
+    """
 
     changed = QtCore.Signal()
+    changing = QtCore.Signal()
     entered = QtCore.Signal()
     exited = QtCore.Signal()
 
@@ -505,7 +1533,7 @@ class QArgument(QtCore.QObject):
     def __init__(self, name, default=None, **kwargs):
         super(QArgument, self).__init__(kwargs.pop("parent", None))
 
-        args = {}
+        args = _ArgumentData()
         args["name"] = name
         args["label"] = kwargs.pop("label", camel_to_title(name))
         args["default"] = self.default if default is None else default
@@ -540,11 +1568,24 @@ class QArgument(QtCore.QObject):
         return "%s(\"%s\")" % (type(self).__name__, self["name"])
 
     def __getitem__(self, key):
-        return self._data[key]
+        # Equivalent to self._data[key], minus one call on this hot path
+        try:
+            return getattr(self._data, key)
+        except AttributeError:
+            return _extra(self._data, key)
 
     def __setitem__(self, key, value):
         self._data[key] = value
 
+        if key == "condition":
+            parser = self.parent()
+
+            if isinstance(parser, QArgumentParser):
+                parser._invalidateCondition(self)
+
+        elif key == "items":
+            self._indexes = None
+
     def __eq__(self, other):
         if isinstance(other, _basestring):
             return self["name"] == other
@@ -559,11 +1600,119 @@ class QArgument(QtCore.QObject):
     def create(self):
         return QtWidgets.QWidget()
 
+    _indexes = None  # Items, their count and index of each, see below
+
+    def _itemIndex(self, value):
+        """Return index of `value` in "items", or None if not an item
+
+        Indexes are kept until items are replaced, or change in number.
+
+        """
+
+        items = self["items"]
+        indexes = self._indexes
+
+        if indexes is None or indexes[0] is not items \
+                or indexes[1] != len(items):
+            start, lookup = 0, {}
+
+            # Only index those added since, as items are fetched lazily
+            if indexes is not None and indexes[0] is items \
+                    and indexes[1] < len(items) and indexes[2] is not None:
+                start, lookup = indexes[1], indexes[2]
+
+            for index in range(start, len(items)):
+                try:
+                    lookup.setdefault(items[index], index)
+                except TypeError:
+                    lookup = None  # Unhashable, such as a list
+                    break
+
+            indexes = self._indexes = (items, len(items), lookup)
+
+        try:
+            return indexes[2].get(value)
+
+        except (AttributeError, TypeError):
+            return items.index(value) if value in items else None
+
+    def coerce(self, value):
+        """Return `value` as the type read from this argument
+
+        Raises:
+            ValueError: If `value` is not valid for this argument
+
+        """
+
+        return value
+
+    def encode(self, value):
+        """Return `value` as stored, see `Storage`
+
+        Values are stored as they are read by default, which must then
+        be of a type supported by JSON; numbers, strings, lists and
+        dictionaries.
+
+        """
+
+        return value
+
+    def decode(self, value):
+        """Return stored `value` as the type read from this argument
+
+        Raises:
+            ValueError: If `value` is not valid for this argument
+
+        """
+
+        return self.coerce(value)
+
+    def _initial(self):
+        """Return the value of this argument prior to having a widget"""
+        initial = self["initial"]
+        return self.coerce(self["default"] if initial is None else initial)
+
+    def _read(self, *args):
+        # Overridden by `create()`, until the widget is deleted
+        try:
+            return self._value
+        except AttributeError:
+            return self._initial()
+
+    def _write(self, value):
+        self._value = value
+
+    def _detach(self):
+        """Keep the value of this argument, ahead of its widget being deleted
+
+        Reads and writes apply to this value until `create()` is called
+        again, after which `_attach()` passes it on to the new widget.
+
+        """
+
+        self._value = self._read()
+        self._data["_widget"] = None
+
+        # Fall back to class-level `_read` and `_write`
+        del self._read
+        del self._write
+
+    def _attach(self):
+        """Pass value kept by `_detach()` on to a newly created widget"""
+        try:
+            value = self.__dict__.pop("_value")
+        except KeyError:
+            return
+
+        if value is not None:
+            self._write(value)
+
     def read(self):
+        _record(self)
         return self._read()
 
     def write(self, value, notify=True):
-        self._write(value)
+        self._write(self.coerce(value))
 
         if notify:
             self.changed.emit()
@@ -599,42 +1748,96 @@ class QArgument(QtCore.QObject):
         )
 
 
-def _with_entered_exited(cls, obj):
-    """Factory function to append `enterEvent` and `leaveEvent`"""
-    class WidgetHoverFactory(cls):
-        entered = QtCore.Signal()
-        exited = QtCore.Signal()
+# Names of arguments read whilst evaluating a condition, see `_evaluate`
+_recording = []
 
-        def enterEvent(self, event):
-            self.entered.emit()
-            obj.entered.emit()
-            return super(WidgetHoverFactory, self).enterEvent(event)
 
-        def leaveEvent(self, event):
-            self.exited.emit()
-            obj.exited.emit()
-            return super(WidgetHoverFactory, self).leaveEvent(event)
+def _record(arg):
+    """Note that `arg` was read, if a condition is being evaluated"""
+    if _recording:
+        _recording[-1].add(arg["name"])
 
-    return WidgetHoverFactory
 
+def _evaluate(condition):
+    """Call `condition`, returning its result and the arguments it read
+
+    Arguments are recorded as they call `QArgument.read()`, such that
+    a condition need only be evaluated again once one of those changes.
+
+    """
+
+    inputs = set()
+    _recording.append(inputs)
+
+    try:
+        result = condition()
+    finally:
+        _recording.pop()
+
+    return result, inputs
+
+
+# Hover-aware subclasses, one per widget type, see `_hover_class`
+_hover_classes = {}
+
+
+def _hover_class(cls):
+    """Return a subclass of `cls` emitting `entered` and `exited`
+
+    Subclasses are made once per widget type and shared amongst every
+    instance, forwarding hover to the QArgument in `_owner`, if any.
+
+    """
+
+    try:
+        return _hover_classes[cls]
+    except KeyError:
+        pass
 
-def _with_entered_exited2(cls):
-    """Factory function to append `enterEvent` and `leaveEvent`"""
     class WidgetHoverFactory(cls):
         entered = QtCore.Signal()
         exited = QtCore.Signal()
 
+        # QArgument of this widget, assigned per instance
+        _owner = None
+
         def enterEvent(self, event):
             self.entered.emit()
+
+            if self._owner is not None:
+                self._owner.entered.emit()
+
             return super(WidgetHoverFactory, self).enterEvent(event)
 
         def leaveEvent(self, event):
             self.exited.emit()
+
+            if self._owner is not None:
+                self._owner.exited.emit()
+
             return super(WidgetHoverFactory, self).leaveEvent(event)
 
+    _hover_classes[cls] = WidgetHoverFactory
     return WidgetHoverFactory
 
 
+def _with_entered_exited(cls, obj):
+    """Factory function to append `enterEvent` and `leaveEvent`"""
+    Widget = _hover_class(cls)
+
+    def factory(*args, **kwargs):
+        widget = Widget(*args, **kwargs)
+        widget._owner = obj
+        return widget
+
+    return factory
+
+
+def _with_entered_exited2(cls):
+    """Factory function to append `enterEvent` and `leaveEvent`"""
+    return _hover_class(cls)
+
+
 class Boolean(QArgument):
     """Boolean type user interface
 
@@ -706,8 +1909,23 @@ class Boolean(QArgument):
 
         return widget
 
-    def read(self):
-        return self._read()
+    def coerce(self, value):
+        # May be stored as string, if used with QSettings(..IniFormat)
+        if isinstance(value, _basestring):
+            try:
+                return {
+                    "": False,
+                    "0": False,
+                    "1": True,
+                    "2": True,
+                    "false": False,
+                    "true": True,
+                }[value.lower()]
+
+            except KeyError:
+                raise ValueError("%r is not a boolean" % value)
+
+        return bool(value)
 
 
 class Tristate(QArgument):
@@ -762,22 +1980,25 @@ class Number(QArgument):
     """Base class of numeric type user interface"""
     default = 0
 
+    _pressed = None  # Value of slider as it was pressed
+    _uncommitted = False  # Spinbox edited, ahead of editing being finished
+
     def create(self):
         if isinstance(self, Float):
             slider = _with_entered_exited(FractionSlider, self)()
             widget = _with_entered_exited(QtWidgets.QDoubleSpinBox, self)()
-            default = self._data.get("default", 0.0)
+            default = self["default"]
             widget.setMinimum(-9999)
             widget.setMaximum(9999)
 
             # Account for small values
             if "stepsize" in self._data:
-                stepsize = self._data["stepsize"]
+                stepsize = self["stepsize"]
                 decimals = abs(int(math.log10(stepsize)))
             else:
                 delta = widget.maximum() - widget.minimum()
                 stepsize = 0.1 if delta < 10 else 1.0
-                minimum = self._data.get("min", 0.0)
+                minimum = self["min"]
                 decimals = len(str(minimum - int(minimum)).rsplit(".")[-1])
 
             widget.setSingleStep(stepsize)
@@ -786,15 +2007,15 @@ class Number(QArgument):
         else:
             slider = _with_entered_exited(QtWidgets.QSlider, self)()
             widget = _with_entered_exited(QtWidgets.QSpinBox, self)()
-            default = self._data.get("default", 0)
+            default = self["default"]
             widget.setMinimum(-9999)
             widget.setMaximum(9999)
 
         widget.setMinimumWidth(px(50))
 
         container = QtWidgets.QWidget()
-        slider.setMinimum(min(default, self._data.get("min", 0)))
-        slider.setMaximum(max(default, self._data.get("max", 99)))
+        slider.setMinimum(min(default, self["min"]))
+        slider.setMaximum(max(default, self["max"]))
         slider.setOrientation(QtCore.Qt.Horizontal)
 
         layout = QtWidgets.QHBoxLayout(container)
@@ -806,12 +2027,22 @@ class Number(QArgument):
         self._widget = widget
 
         # Synchonise spinbox with slider
-        widget.editingFinished.connect(self.changed.emit)
+        widget.editingFinished.connect(self.on_editing_finished)
         widget.valueChanged.connect(self.on_spinbox_changed)
         slider.valueChanged.connect(self.on_slider_changed)
+        slider.sliderPressed.connect(self.on_slider_pressed)
+        slider.sliderReleased.connect(self.on_slider_released)
+
+        def write(value):
+            # Written values are no edit, `write()` emits `changed` once
+            widget.blockSignals(True)
+            widget.setValue(value)
+            widget.blockSignals(False)
+
+            self._sync(value)
 
         self._read = lambda: widget.value()
-        self._write = lambda value: widget.setValue(value)
+        self._write = write
 
         initial = self["initial"]
 
@@ -823,21 +2054,58 @@ class Number(QArgument):
 
         return container
 
+    def coerce(self, value):
+        cast = float if isinstance(self, Float) else int
+
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            raise ValueError("%r is not a number" % (value,))
+
+    def _sync(self, value):
+        """Move slider to `value`, without it emitting a change"""
+        slider = self._slider
+
+        slider.blockSignals(True)
+
+        if value > slider.maximum():
+            slider.setMaximum(value)
+
+        if value < slider.minimum():
+            slider.setMinimum(value)
+
+        slider.setValue(value)
+        slider.blockSignals(False)
+
     def on_spinbox_changed(self, value):
-        if value > self._slider.maximum():
-            self._slider.setMaximum(value)
+        self._sync(value)
 
-        if value < self._slider.minimum():
-            self._slider.setMinimum(value)
+        # Committed once editing is finished
+        self._uncommitted = True
+        self.changing.emit()
 
-        self._slider.setValue(value)
-        # Spinbox emits a signal all on its own
+    def on_editing_finished(self):
+        if self._uncommitted:
+            self._uncommitted = False
+            self.changed.emit()
 
     def on_slider_changed(self, value):
+        self._widget.blockSignals(True)
         self._widget.setValue(value)
+        self._widget.blockSignals(False)
+
+        # Committed once released, if dragged
+        if self._slider.isSliderDown():
+            self.changing.emit()
+        else:
+            self.changed.emit()
 
-        # Help spinbox emit this change
-        self.changed.emit()
+    def on_slider_pressed(self):
+        self._pressed = self._slider.value()
+
+    def on_slider_released(self):
+        if self._slider.value() != self._pressed:
+            self.changed.emit()
 
 
 class Integer(Number):
@@ -920,6 +2188,14 @@ class Double3(QArgument):
 
         return widget
 
+    def coerce(self, value):
+        try:
+            x, y, z = (float(v) for v in value)
+        except (TypeError, ValueError):
+            raise ValueError("%r is not three numbers" % (value,))
+
+        return (x, y, z)
+
     def child_arg(self, layout, index):
         widget = _with_entered_exited(QtWidgets.QLineEdit, self)()
         widget.setValidator(QtGui.QDoubleValidator())
@@ -964,16 +2240,19 @@ class String(QArgument):
         # There's no reasonable default value for a string
         return False
 
+    def coerce(self, value):
+        return "" if value is None else value
+
     def create(self):
         widget = _with_entered_exited(QtWidgets.QLineEdit, self)()
         widget.editingFinished.connect(self.onEditingFinished)
         self._read = lambda: widget.text()
         self._write = lambda value: widget.setText(value)
 
-        if isinstance(self, Info) or not self._data.get("editable", True):
+        if isinstance(self, Info) or not self["editable"]:
             widget.setReadOnly(True)
 
-        widget.setPlaceholderText(self._data.get("placeholder") or "")
+        widget.setPlaceholderText(self["placeholder"] or "")
 
         initial = self["initial"]
 
@@ -1000,6 +2279,17 @@ class String2(String):
     def isEdited(self):
         return any(self.read())
 
+    def coerce(self, value):
+        if value is None:
+            return ("", "")
+
+        try:
+            a, b = value
+        except (TypeError, ValueError):
+            raise ValueError("%r is not a pair of strings" % (value,))
+
+        return (a, b)
+
     def create(self):
         a = _with_entered_exited(QtWidgets.QLineEdit, self)()
         b = _with_entered_exited(QtWidgets.QLineEdit, self)()
@@ -1025,7 +2315,7 @@ class String2(String):
         if isinstance(self, Info):
             a.setReadOnly(True)
 
-        placeholder = self._data.get("placeholder") or ("", "")
+        placeholder = self["placeholder"] or ("", "")
         a.setPlaceholderText(placeholder[0])
         b.setPlaceholderText(placeholder[1])
 
@@ -1178,35 +2468,103 @@ class InfoList(QArgument):
 
     Presented by `QtWidgets.QListView`, not production ready.
 
+    Lines may be appended as they come, such as the output of a running
+    job, of which only the last `maxlen` lines are kept.
+
+    Arguments:
+        name (str): The name of argument
+        default (list, optional): Lines, default `["Empty"]`
+        maxlen (int, optional): Lines kept, dropping the oldest first,
+            default None, keeping every line
+
     """
 
+    _model = None  # Given by `create()`
+
     def __init__(self, name, **kwargs):
         kwargs["default"] = kwargs.pop("default", ["Empty"])
+        maxlen = kwargs.pop("maxlen", None)
         super(InfoList, self).__init__(name, **kwargs)
 
+        self["maxlen"] = maxlen
+
+        # Lines of this argument whilst it has no widget, once written
+        self._lines = None
+
+    def coerce(self, value):
+        return list(value or [])
+
     def create(self):
-        class Model(QtCore.QStringListModel):
-            def data(self, index, role):
-                return super(Model, self).data(index, role)
+        def on_about_to_flush():
+            scrollbar = widget.verticalScrollBar()
+            following[:] = [scrollbar.value() == scrollbar.maximum()]
+
+        def on_flushed():
+            if following[0]:
+                widget.scrollToBottom()
+
+        following = [True]  # Was the end in view, prior to appending
+
+        model = _LinesModel(self["maxlen"])
+        model.reset(self._read())
+        model.aboutToFlush.connect(on_about_to_flush)
+        model.flushed.connect(on_flushed)
 
-        model = QtCore.QStringListModel(self["default"])
         widget = _with_entered_exited(QtWidgets.QListView, self)()
         widget.setModel(model)
         widget.setEditTriggers(widget.NoEditTriggers)
 
-        self._read = lambda: model.stringList()
-        self._write = lambda value: model.setStringList(value)
-
-        initial = self["initial"]
+        # Lines are single lines of text, spare the view from measuring each
+        widget.setUniformItemSizes(True)
 
-        if initial is None:
-            initial = self["default"]
+        self._read = lambda: model.lines()
+        self._write = lambda value: model.reset(value)
+        self._model = model
 
-        if initial is not None:
-            self._write(initial)
+        # Kept by the model, until its widget is deleted
+        self._lines = None
 
         return widget
 
+    def append(self, line):
+        """Append `line`, without emitting `changed`"""
+        self.extend([line])
+
+    def extend(self, lines):
+        """Append `lines`, without emitting `changed`
+
+        Lines appended to a widget are shown together, once control
+        returns to the event loop.
+
+        """
+
+        if self._model is not None:
+            self._model.extend(lines)
+        else:
+            if self._lines is None:
+                self._write(self._initial())
+
+            self._lines.extend(lines)
+
+    def _read(self, *args):
+        if self._lines is None:
+            return self._initial()
+
+        return list(self._lines)
+
+    def _write(self, value):
+        self._lines = deque(value, self["maxlen"])
+
+    def _detach(self):
+        # Kept by class-level `_write`, rather than the model being deleted
+        InfoList._write(self, self._read())
+        self._data["_widget"] = None
+        self._model = None
+
+        # Fall back to class-level `_read` and `_write`
+        del self._read
+        del self._write
+
 
 class Choice(QArgument):
     """Argument user interface for selecting one from list
@@ -1220,21 +2578,49 @@ class Choice(QArgument):
         items (list, optional): List of strings for select, default `["Empty"]`
         default (str, optional): Default item in `items`, use first of `items`
             if not given.
+        filterable (bool, optional): Show only items containing what is
+            typed into a box above the list
         enabled (bool, optional): Whether to enable this widget, default True
 
     """
 
     def __init__(self, name, **kwargs):
         kwargs["items"] = kwargs.get("items", ["Empty"])
-        kwargs["default"] = kwargs.pop("default", kwargs["items"][0])
+        filterable = kwargs.pop("filterable", False)
+
+        # Also when passed as None, such as by `addArgument()`
+        if kwargs.get("default") is None:
+            kwargs["default"] = kwargs["items"][0]
+
         super(Choice, self).__init__(name, **kwargs)
 
+        self["filterable"] = filterable
+
     def index(self, value):
         """Return numerical equivalent to self.read()"""
-        return self["items"].index(value)
+        index = self._itemIndex(value)
+
+        if index is None:
+            raise ValueError("%r is not in list" % (value,))
+
+        return index
+
+    def coerce(self, value):
+        items = self["items"]
+
+        if value == "Empty" and items:
+            return items[0]
+
+        if self._itemIndex(value) is None:
+            raise ValueError("%s not a member of %s" % (value, items))
+
+        return value
 
     def create(self):
         def on_changed(selected, deselected):
+            if filtering:
+                return
+
             try:
                 selected = selected.indexes()[0]
             except IndexError:
@@ -1246,43 +2632,115 @@ class Choice(QArgument):
             self.changed.emit()
 
         def set_current(current):
-            options = model.stringList()
+            options = self["items"]  # As given to the model
 
             if current == "Empty":
                 index = 0
             else:
-                for index, member in enumerate(options):
-                    if member == current:
-                        break
-                else:
+                index = self._itemIndex(current)
+
+                if index is None:
                     raise ValueError(
                         "%s not a member of %s" % (current, options)
                     )
 
-            qindex = model.index(index, 0, QtCore.QModelIndex())
-            smodel.setCurrentIndex(qindex, type(smodel).ClearAndSelect)
             self["current"] = options[index]
+            select(index)
+
+        def select(index):
+            row = index
+
+            if shown:
+                rows = shown[0]
+                row = bisect.bisect_left(rows, index)
+
+                if row == len(rows) or rows[row] != index:
+                    # Filtered out, remains current until shown again
+                    filtering.append(True)
+                    try:
+                        smodel.clear()
+                    finally:
+                        filtering.pop()
+
+                    return
+
+            qindex = model.index(row, 0, QtCore.QModelIndex())
+            smodel.setCurrentIndex(qindex, type(smodel).ClearAndSelect)
 
         def reset(items, default=None):
-            items = items or ["Empty"]
+            items = self["items"] = items or ["Empty"]
+            texts[:] = []
+            shown[:] = []
             model.setStringList(items)
             set_current(default or items[0])
 
+            if search is not None and search.text():
+                on_filter(search.text())
+
+        def on_filter(text):
+            items = self["items"]
+            shown[:] = []
+
+            if text.strip():
+                # Made once per reset, on the first keystroke
+                if not texts:
+                    texts.append(_TextIndex(items))
+
+                shown.append(texts[0].search(text))
+                items = [items[index] for index in shown[0]]
+
+            # Replaced in one go, rather than hiding rows one at a time
+            filtering.append(True)
+            try:
+                model.setStringList(items)
+                select(self._itemIndex(self["current"]))
+            finally:
+                filtering.pop()
+
+            widget.scrollTo(widget.currentIndex())
+
+        texts = []  # See `_TextIndex`
+        shown = []  # Indexes of items matching the filter, if filtered
+        filtering = []  # Selection changed by filtering, rather than user
+
         model = QtCore.QStringListModel()
         widget = _with_entered_exited(QtWidgets.QListView, self)()
         widget.setModel(model)
         widget.setEditTriggers(widget.NoEditTriggers)
         widget.setSelectionMode(widget.SingleSelection)
+
+        # Rows are single lines of text, spare the view from measuring each
+        widget.setUniformItemSizes(True)
+
         smodel = widget.selectionModel()
         smodel.selectionChanged.connect(on_changed)
 
+        search = None
+
+        if self["filterable"]:
+            search = QtWidgets.QLineEdit()
+            search.setPlaceholderText("Filter..")
+            search.setClearButtonEnabled(True)
+            search.textChanged.connect(on_filter)
+
         self._read = lambda: self["current"]
         self._write = lambda value: set_current(value)
         self.reset = reset
 
-        reset(self["items"], self["default"])
+        reset(self["items"], self._initial())
 
-        return widget
+        if search is None:
+            return widget
+
+        # Containerise to allow for internal changes by the user
+        container = QtWidgets.QWidget()
+        container.setObjectName("Container")
+        layout = QtWidgets.QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(search)
+        layout.addWidget(widget, 1)
+
+        return container
 
 
 class ListItem(dict):
@@ -1290,6 +2748,19 @@ class ListItem(dict):
 
 
 class List(QArgument):
+    """Items of one or more roles, of which one may be selected
+
+    Presented by `GenericTreeView`, of a `GenericListModel`.
+
+    Arguments:
+        name (str): The name of argument
+        items (list, optional): Items of type `ListItem`, a dictionary of
+            role and value. Items are assumed to be of the same size.
+
+    """
+
+    _model = None  # Given by `create()`
+
     def isEdited(self):
         return False
 
@@ -1298,7 +2769,16 @@ class List(QArgument):
             "Items of a List must be of type ListItem"
         )
 
-        widget = _with_entered_exited(QtWidgets.QListWidget, self)()
+        model = GenericListModel()
+        widget = _with_entered_exited(GenericTreeView, self)()
+        widget.setModel(model)
+        widget.setIndentation(0)
+        widget.setRootIsDecorated(False)
+        widget.setHeaderHidden(True)
+
+        # Spare the view from measuring each item, and Python from being
+        # asked for each row, which a QListView lays out one at a time
+        widget.setUniformRowHeights(True)
 
         # Containerise to allow for internal changes by the user
         container = QtWidgets.QWidget()
@@ -1307,90 +2787,206 @@ class List(QArgument):
         layout.setContentsMargins(0, 0, 0, 0)
 
         def reset(items, current=0):
-            for item in items:
-                qitem = QtWidgets.QListWidgetItem()
-
-                for role, value in item.items():
-                    qitem.setData(role, value)
-
-                widget.addItem(qitem)
+            model.reset(items)
 
             if items:
-                widget.setCurrentRow(current)
-
-        reset(self["items"])
+                widget.setCurrentIndex(model.index(current, 0))
 
         def read():
-            item = widget.currentItem()
-            if item is not None:
-                return item.text()
-            return ""
+            value = widget.currentIndex().data(QtCore.Qt.DisplayRole)
+            return "" if value is None else value
 
         def write(value):
-            item = widget.currentItem()
-            if item is not None:
-                item.setText(value)
+            index = widget.currentIndex()
+            if index.isValid():
+                model.setData(index, value)
+
+        def current():
+            return widget.currentIndex().row()
+
+        def setCurrent(row):
+            widget.setCurrentIndex(model.index(row, 0))
 
         self._read = read
         self._write = write
         self._reset = reset
+        self._current = current
+        self._setCurrent = setCurrent
+        self._model = model
+
+        reset(self["items"])
 
         return container
 
     def reset(self, items=None, current=0):
         self["items"][:] = items or []
-        self._reset(items, current)
+
+        if self._model is not None:
+            self._reset(self["items"], current)
+
+    def extend(self, items):
+        """Append `items`, in one go"""
+        items = list(items)
+        self["items"].extend(items)
+
+        if self._model is not None:
+            self._model.extend(items)
+
+    def _detach(self):
+        # Selection is kept by row, as `_write()` renames the current
+        # item rather than selecting one
+        row = self._current()
+        super(List, self)._detach()
+
+        # Deleted alongside its widget, items are recreated from "items"
+        self._model = None
+        self._row = row
+
+        del self._current
+        del self._setCurrent
+
+    def _attach(self):
+        self.__dict__.pop("_value", None)
+        row = self.__dict__.pop("_row", -1)
+
+        if 0 <= row < len(self["items"]):
+            self._setCurrent(row)
 
 
 class Table(QArgument):
+    """Rows of one or more columns, of which one may be selected
+
+    Arguments:
+        name (str): The name of argument
+        items (list, optional): Rows, as dictionaries of role and value,
+            with a tuple of values for more than one column. May also be
+            an iterator, or a function of offset and count returning that
+            many rows, from which rows are fetched as they are scrolled to
+        columns (list, optional): Rather than `items`, a sequence of
+            values per column, such as a `list`, an `array.array` or a
+            NumPy array, for tables of many rows
+        sortable (bool, optional): Sort rows by clicking a column header
+        filterable (bool, optional): Filter rows by text typed into a box
+            above the table
+
+    """
+
     doubleClicked = QtCore.Signal()
 
+    _model = None  # Given by `create()`
+
+    # Number of rows fetched at a time, from an iterator or function
+    fetchSize = 100
+
+    def __init__(self, name, **kwargs):
+        columns = kwargs.pop("columns", None)
+        sortable = kwargs.pop("sortable", False)
+        filterable = kwargs.pop("filterable", False)
+        super(Table, self).__init__(name, **kwargs)
+
+        self["sortable"] = sortable
+        self["filterable"] = filterable
+
+        if columns is not None:
+            columns = [_column(values) for values in columns]
+
+        self["columns"] = columns
+        self["items"] = self._setSource(self["items"])
+
     def isEdited(self):
         return False
 
     def create(self):
-        model = GenericTreeModel()
+        columns = self["columns"]
+
+        if columns is not None:
+            model = GenericTableModel()
+            model.reset(columns)
+        else:
+            model = GenericTreeModel()
+
         view = _with_entered_exited(GenericTreeView, self)()
         view.setIndentation(0)
         view.setHeaderHidden(True)
-        view.setModel(model)
+
+        # Rows are single lines of text, spare the view from measuring each
+        view.setUniformRowHeights(True)
+
+        # Sorted and filtered in a thread of its own, see GenericProxyModel
+        proxy = None
+
+        if self["sortable"] or self["filterable"]:
+            proxy = GenericProxyModel(view)
+            proxy.setSourceModel(model)
+            view.setModel(proxy)
+        else:
+            view.setModel(model)
+
+        if self["sortable"]:
+            view.setHeaderHidden(False)
+            view.header().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+            view.setSortingEnabled(True)
 
         def reset(items, header=None, current=None):
-            root_item = GenericTreeModelItem({
-                QtCore.Qt.DisplayRole: header or ("",),
-            })
+            items = items or []
 
-            current_row = None
-            for row, item in enumerate(items or []):
-                child_item = GenericTreeModelItem(item)
-                root_item.addChild(child_item)
+            if columns is not None:
+                model.resetItems(items)
 
-                if current is not None:
-                    other = item.get(QtCore.Qt.DisplayRole, "")
+            else:
+                root_item = GenericTreeModelItem({
+                    QtCore.Qt.DisplayRole: header or ("",),
+                })
 
-                    if isinstance(other, (tuple, list)):
-                        other = other[0]
+                root_item.addChildren([
+                    GenericTreeModelItem(item) for item in items
+                ])
 
-                    if current == other:
-                        current_row = row
+                model.reset(root_item)
 
-            # Establish a sensible default
-            model.reset(root_item)
+            current_row = None
+            for row, item in enumerate(items):
+                if current is not None and current == _first_column(item):
+                    current_row = row
 
             if current_row is not None:
-                index = model.index(current_row, 0)
-
-                if index.isValid():
-                    sel_model = view.selectionModel()
-                    sel_model.select(
-                        index,
-                        type(selection).ClearAndSelect | type(selection).Rows
-                    )
-                    view.scrollTo(index)
+                setCurrent(current_row)
 
             self.changed.emit()
 
-        reset(self["items"], ("key", "value"))
+        def current():
+            """Return row of `model` selected, or -1"""
+            indexes = selection.selectedIndexes()
+
+            if not indexes:
+                return -1
+
+            index = indexes[0]
+            if proxy is not None:
+                index = proxy.mapToSource(index)
+
+            return index.row()
+
+        def setCurrent(row):
+            index = model.index(row, 0)
+
+            if proxy is not None:
+                index = proxy.mapFromSource(index)
+
+            if index.isValid():
+                selection.select(
+                    index,
+                    type(selection).ClearAndSelect | type(selection).Rows
+                )
+                view.scrollTo(index)
+
+        selection = view.selectionModel()
+
+        if columns is None:
+            reset(self["items"], ("key", "value"))
+
+        if self._source is not None:
+            model.setFetch(self.fetchMore)
 
         def read(role=QtCore.Qt.DisplayRole):
             index = view.selectionModel().selectedIndexes()
@@ -1403,7 +2999,7 @@ class Table(QArgument):
                 return ""
 
             # Find column 0, in case another column was selected
-            index = model.index(index.row(), 0, index.parent())
+            index = index.sibling(index.row(), 0)
 
             if not index.isValid():
                 return ""
@@ -1416,81 +3012,890 @@ class Table(QArgument):
             # if item is not None:
             #     item.setText(column, value)
 
-        selection = view.selectionModel()
         selection.currentChanged.connect(self.onItemChanged)
         view.doubleClicked.connect(self.onItemDoubleClicked)
 
         # Containerise to allow for internal changes by the user
         container = QtWidgets.QWidget()
         container.setObjectName("Container")
-        layout = QtWidgets.QHBoxLayout(container)
-        layout.addWidget(view, 1)
+        layout = QtWidgets.QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self._read = read
-        self._write = write
-        self._reset = reset
-        self._model = model
+        if self["filterable"]:
+            search = QtWidgets.QLineEdit()
+            search.setPlaceholderText("Filter..")
+            search.setClearButtonEnabled(True)
+            search.textChanged.connect(proxy.setFilter)
+            layout.addWidget(search)
+
+        layout.addWidget(view, 1)
+
+        self._read = read
+        self._write = write
+        self._reset = reset
+        self._current = current
+        self._setCurrent = setCurrent
+        self._model = model
+
+        return container
+
+    def read(self, role=QtCore.Qt.DisplayRole):
+        _record(self)
+        return self._read(role)
+
+    def reset(self, items=None, header=None, current=None):
+        items = self._setSource(items)
+
+        if self["columns"] is None:
+            self["items"][:] = items
+
+        elif self._model is None:
+            columns = self["columns"]
+            _remove_column_rows(columns, 0, self._rowCount())
+            _insert_column_rows(columns, 0, items)
+
+        if self._model is not None:
+            self._reset(items, header, current)
+
+            if self._source is not None:
+                self._model.setFetch(self.fetchMore)
+
+    def _setSource(self, items):
+        """Return rows of `items`, keeping an iterator or function for later"""
+        self._source = None
+
+        if items is None:
+            return []
+
+        if isinstance(items, (list, tuple)):
+            return list(items) if isinstance(items, tuple) else items
+
+        if callable(items):
+            items = _paged(items, self.fetchSize)
+
+        self._source = iter(items)
+        return []
+
+    def canFetchMore(self):
+        return self._source is not None
+
+    def fetchMore(self, count=None):
+        """Append up to `count` rows from the iterator or function given
+
+        Called as the user scrolls to the end of those already fetched.
+
+        """
+
+        if self._source is None:
+            return
+
+        count = count or self.fetchSize
+        items = list(itertools.islice(self._source, count))
+
+        if len(items) < count:
+            self._source = None
+
+            if self._model is not None:
+                self._model.setFetch(None)
+
+        self.insertRows(self._rowCount(), items)
+
+    def _rowCount(self):
+        columns = self["columns"]
+
+        if columns is None:
+            return len(self["items"])
+
+        return len(columns[0]) if columns else 0
+
+    def insertRows(self, row, items):
+        """Insert `items` at `row`, keeping selection and scroll position"""
+        if self["columns"] is None:
+            self["items"][row:row] = items
+
+        elif self._model is None:
+            _insert_column_rows(self["columns"], row, items)
+
+        if self._model is not None:
+            self._model.insertItems(row, items)
+
+    def removeRows(self, row, count=1):
+        """Remove `count` rows from `row`"""
+        if self["columns"] is None:
+            del self["items"][row:row + count]
+
+        elif self._model is None:
+            _remove_column_rows(self["columns"], row, count)
+
+        if self._model is not None:
+            self._model.removeItems(row, count)
+
+    def updateRows(self, row, items):
+        """Replace rows from `row` onwards with `items`"""
+        if self["columns"] is None:
+            self["items"][row:row + len(items)] = items
+
+        elif self._model is None:
+            _update_column_rows(self["columns"], row, items)
+
+        if self._model is not None:
+            self._model.updateItems(row, items)
+
+    def rows(self):
+        """Return every row, as passed to `reset()`"""
+        columns = self["columns"]
+
+        if columns is None:
+            return list(self["items"])
+
+        return [
+            {QtCore.Qt.DisplayRole: values}
+            for values in zip(*columns)
+        ]
+
+    def diffReset(self, items, key=None):
+        """Change rows to match `items`, with as few changes as possible
+
+        Unlike `reset()`, rows that remain keep their selection, and only
+        rows actually inserted, removed or updated are repainted.
+
+        Arguments:
+            items (list): Every row, as passed to `reset()`
+            key (callable, optional): Return a hashable identity of an
+                item, such as the primary key of a database record.
+                Defaults to the value of its first column
+
+        """
+
+        key = key or _first_column
+        current = self.rows()
+        opcodes = _opcodes(
+            [key(item) for item in current],
+            [key(item) for item in items],
+        )
+
+        # From the bottom up, such that rows above remain where they are
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                self._updateChanged(i1, current[i1:i2], items[j1:j2])
+
+            elif tag == "replace" and i2 - i1 == j2 - j1:
+                self.updateRows(i1, items[j1:j2])
+
+            else:
+                if i2 > i1:
+                    self.removeRows(i1, i2 - i1)
+
+                if j2 > j1:
+                    self.insertRows(i1, items[j1:j2])
+
+    def _updateChanged(self, row, current, items):
+        """Update consecutive rows of `items` which differ from `current`"""
+        start = None
+
+        for offset, item in enumerate(items + [None]):
+            changed = item is not None and current[offset] != item
+
+            if changed and start is None:
+                start = offset
+
+            elif not changed and start is not None:
+                self.updateRows(row + start, items[start:offset])
+                start = None
+
+    def _detach(self):
+        # Selection is kept by row, as `_write()` takes a column and
+        # value rather than what `_read()` returns
+        row = self._current()
+        super(Table, self)._detach()
+
+        # Deleted alongside its widget, rows are recreated from "items"
+        self._model = None
+        self._row = row
+
+        del self._current
+        del self._setCurrent
+
+    def _attach(self):
+        self.__dict__.pop("_value", None)
+        row = self.__dict__.pop("_row", -1)
+
+        if 0 <= row < self._rowCount():
+            self._setCurrent(row)
+
+    def setHeader(self, *columns):
+        header = self._widget.headerItem()
+        for index, label in enumerate(columns):
+            header.setText(index, label)
+
+        if columns:
+            self._widget.setHeaderHidden(True)
+        else:
+            self._widget.setHeaderHidden(False)
+
+    def onItemChanged(self, current, previous):
+        # Give selection model a chance to update its selection
+        QtCore.QTimer.singleShot(10, self.changed.emit)
+
+    def onItemDoubleClicked(self):
+        def emit():
+            self.doubleClicked.emit()
+
+        # Give widget a chance to render
+        QtCore.QTimer.singleShot(10, emit)
+
+    # Optional PEP08 syntax
+    insert_rows = insertRows
+    remove_rows = removeRows
+    update_rows = updateRows
+    diff_reset = diffReset
+    can_fetch_more = canFetchMore
+    fetch_more = fetchMore
+
+
+def _runs(rows):
+    """Return first and last of each run of consecutive, ascending `rows`"""
+    runs = []
+
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+
+    return runs
+
+
+def _opcodes(a, b):
+    """Return opcodes of `difflib.SequenceMatcher`, turning `a` into `b`
+
+    Only what lies between any common beginning and end is compared,
+    such as when rows are updated without any being added or removed.
+
+    """
+
+    if a == b:
+        return [("equal", 0, len(a), 0, len(b))] if a else []
+
+    start = 0
+    end = min(len(a), len(b))
+    while start < end and a[start] == b[start]:
+        start += 1
+
+    stop = 0
+    while stop < end - start and a[-1 - stop] == b[-1 - stop]:
+        stop += 1
+
+    opcodes = [("equal", 0, start, 0, start)] if start else []
+
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(
+        None,
+        a[start:len(a) - stop],
+        b[start:len(b) - stop],
+        autojunk=False,
+    ).get_opcodes():
+        opcodes.append((tag, i1 + start, i2 + start, j1 + start, j2 + start))
+
+    if stop:
+        opcodes.append(
+            ("equal", len(a) - stop, len(a), len(b) - stop, len(b))
+        )
+
+    return opcodes
+
+
+class _NumpyColumn(object):
+    """A NumPy array, changed in place like a list
+
+    Values are given as Python types, as expected by Qt.
+
+    """
+
+    def __init__(self, values):
+        self.array = values
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.array.tolist())
+
+    def __getitem__(self, index):
+        return self.array[index].item()
+
+    def __setitem__(self, index, values):
+        import numpy
+
+        start, stop, _ = index.indices(len(self.array))
+        self.array = numpy.concatenate((
+            self.array[:start],
+            numpy.asarray(values, dtype=self.array.dtype),
+            self.array[stop:],
+        ))
+
+    def __delitem__(self, index):
+        self[index] = []
+
+
+def _paged(fetch, count):
+    """Yield rows of `fetch(offset, count)`, until it returns none"""
+    offset = 0
+
+    while True:
+        items = fetch(offset, count)
+
+        if not items:
+            return
+
+        for item in items:
+            yield item
+
+        offset += len(items)
+
+
+def _column(values):
+    """Return `values` of a column, wrapping any NumPy array"""
+    if type(values).__module__ == "numpy":
+        return _NumpyColumn(values)
+
+    return values
+
+
+def _splice(column, start, stop, values):
+    """Replace rows `start` to `stop` of `column` with `values`"""
+    if isinstance(column, array.array):
+        values = array.array(column.typecode, values)
+
+    column[start:stop] = values
+
+
+def _insert_column_rows(columns, row, items):
+    values = list(zip(*[item[QtCore.Qt.DisplayRole] for item in items]))
+
+    for index, column in enumerate(columns):
+        _splice(column, row, row, values[index] if values else [])
+
+
+def _remove_column_rows(columns, row, count):
+    for column in columns:
+        _splice(column, row, row + count, [])
+
+
+def _update_column_rows(columns, row, items):
+    values = list(zip(*[item[QtCore.Qt.DisplayRole] for item in items]))
+
+    for index, column in enumerate(columns):
+        _splice(column, row, row + len(items), values[index] if values else [])
+
+
+def _first_column(item):
+    """Return the display value of the first column of Table `item`"""
+    value = item.get(QtCore.Qt.DisplayRole, "")
+
+    if isinstance(value, (tuple, list)):
+        value = value[0]
+
+    return value
+
+
+class Separator(QArgument):
+    """Visual separator
+
+    Example:
+
+        item1
+        item2
+        ------------
+        item3
+        item4
+
+    """
+
+    def __init__(self, name, **kwargs):
+        super(Separator, self).__init__(name, **kwargs)
+        self._data["editable"] = False
+
+    def create(self):
+        widget = _with_entered_exited(QtWidgets.QWidget, self)()
+
+        self._read = lambda: None
+        self._write = lambda value: None
+
+        return widget
+
+    def reset(self):
+        # This ain't got no default value
+        pass
+
+
+def _read_image(path, size):
+    """Return image at `path`, scaled down to fit within `size`
+
+    Formats supporting it, such as JPEG, are decoded at that size rather
+    than in full. The image is null if it could not be read.
+
+    """
+
+    reader = QtGui.QImageReader(path)
+    full = reader.size()
+
+    if full.isValid() and full.boundedTo(size) != full:
+        reader.setScaledSize(full.scaled(size, QtCore.Qt.KeepAspectRatio))
+
+    image = reader.read()
+
+    if not image.isNull() and image.size().boundedTo(size) != image.size():
+        image = image.scaled(
+            size,
+            QtCore.Qt.KeepAspectRatio,
+            QtCore.Qt.SmoothTransformation
+        )
+
+    return image
+
+
+def _touch(fname):
+    """Update time of modification of `fname` to now, if possible"""
+    try:
+        os.utime(fname, None)
+    except OSError:
+        pass
+
+
+class ThumbnailCache(object):
+    """Images scaled down to fit a size, by path and time of modification
+
+    Thumbnails most recently used are kept in memory up to `budget` bytes,
+    and on disk in `directory` if given up to `diskBudget` bytes, such that
+    images are read in full only once. Thumbnails may be read and stored
+    from any thread.
+
+    Arguments:
+        budget (int, optional): Bytes of thumbnails kept in memory,
+            default 32 MB
+        directory (str, optional): Keep thumbnails on disk, here
+        format (str, optional): Format of thumbnails on disk, "PNG"
+            by default, or "JPG" for smaller files without transparency
+        diskBudget (int, optional): Bytes of thumbnails kept on disk,
+            default 256 MB, of which those least recently used are removed
+
+    """
+
+    def __init__(self,
+                 budget=32 * 1024 ** 2,
+                 directory=None,
+                 format="PNG",
+                 diskBudget=256 * 1024 ** 2):
+
+        self._budget = budget
+        self._directory = directory
+        self._format = format
+        self._diskBudget = diskBudget
+
+        self._images = odict()  # Time of modification and image, by key
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._diskBytes = None  # Counted on first save
+        self._diskLock = threading.Lock()
+
+    def get(self, path, size):
+        """Return thumbnail of `path` at `size` kept in memory, or None
+
+        Whether `path` was modified since is not checked, such as to not
+        wait on the file system, which `read()` does.
+
+        """
+
+        entry = self._get(self._key(path, size))
+        return entry[1] if entry is not None else None
+
+    def read(self, path, size):
+        """Return thumbnail of `path` at `size`, from memory, disk or image
+
+        The thumbnail is kept in memory and on disk, unless it could not
+        be read, in which case it is null.
+
+        """
+
+        key = self._key(path, size)
+
+        try:
+            mtime = os.stat(key[0]).st_mtime
+        except OSError:
+            return QtGui.QImage()
+
+        entry = self._get(key)
+
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        fname = self._fileName(key, mtime)
+        image = None
+
+        if fname is not None and os.path.isfile(fname):
+            image = QtGui.QImage(fname)
+
+            if not image.isNull():
+                _touch(fname)  # Now most recently used on disk
+
+        if image is None or image.isNull():
+            image = _read_image(path, size)
+
+            if image.isNull():
+                return image
+
+            if fname is not None:
+                self._save(image, fname)
+
+        self._put(key, mtime, image)
+
+        return image
+
+    def clear(self):
+        """Forget thumbnails kept in memory"""
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+
+    def _key(self, path, size):
+        return (os.path.abspath(path), size.width(), size.height())
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._images.pop(key, None)
+
+            if entry is not None:
+                self._images[key] = entry  # Now most recently used
+
+            return entry
+
+    def _put(self, key, mtime, image):
+        size = image.bytesPerLine() * image.height()
+
+        with self._lock:
+            previous = self._images.pop(key, None)
+
+            if previous is not None:
+                _, previous = previous
+                self._bytes -= previous.bytesPerLine() * previous.height()
+
+            self._images[key] = (mtime, image)
+            self._bytes += size
+
+            while self._bytes > self._budget and len(self._images) > 1:
+                _, (_, oldest) = self._images.popitem(last=False)
+                self._bytes -= oldest.bytesPerLine() * oldest.height()
+
+    def _fileName(self, key, mtime):
+        if self._directory is None:
+            return None
+
+        path, width, height = key
+        name = hashlib.sha1(
+            repr((path, mtime, width, height)).encode("utf-8")
+        ).hexdigest()
+
+        return os.path.join(
+            self._directory, "%s.%s" % (name, self._format.lower())
+        )
+
+    def _save(self, image, fname):
+        dirname = os.path.dirname(fname)
+
+        try:
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+
+            fd, tmp = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+            os.close(fd)
+
+        except OSError:
+            _log.warning("Could not store thumbnail in %s" % dirname)
+            return
+
+        # Replaced as a whole, such as to never read a partial thumbnail
+        if image.save(tmp, self._format):
+            _replace(tmp, fname)
+            self._trim(os.path.getsize(fname))
+        else:
+            os.remove(tmp)
+
+    def _trim(self, added):
+        """Remove thumbnails least recently used, once over `diskBudget`
+
+        Down to three quarters of it, such as to not list every thumbnail
+        on each one added.
+
+        """
+
+        with self._diskLock:
+            if self._diskBytes is None:
+                self._diskBytes = sum(size for _, size, _ in self._files())
+            else:
+                self._diskBytes += added
+
+            if self._diskBytes <= self._diskBudget:
+                return
+
+            files = sorted(self._files())
+            total = sum(size for _, size, _ in files)
+
+            for _, size, fname in files:
+                if total <= self._diskBudget * 3 // 4:
+                    break
+
+                try:
+                    os.remove(fname)
+                except OSError:
+                    continue  # Removed by another process, or in use
+
+                total -= size
+
+            self._diskBytes = total
+
+    def _files(self):
+        """Return time of use, size and path of each thumbnail on disk"""
+        suffix = "." + self._format.lower()
+
+        try:
+            names = os.listdir(self._directory)
+        except OSError:
+            return []
+
+        files = []
+        for name in names:
+            if not name.endswith(suffix):
+                continue
+
+            fname = os.path.join(self._directory, name)
+
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, fname))
+
+        return files
+
+
+class ImageBuffer(object):
+    """Pixels of an image in memory, such as `bytes`, a `memoryview` or `mmap`
+
+    Pixels are shown without copying them, such that changes made to them
+    in place are shown once written again, such as for live previews.
+
+    Arguments:
+        data (object): Pixels, by any object supporting the buffer protocol
+        width (int): Pixels per line
+        height (int): Lines
+        format (QImage.Format, optional): Format of each pixel,
+            default `QImage.Format_RGBA8888`
+        bytesPerLine (int, optional): Bytes from one line to the next,
+            default that of `width` pixels
+
+    """
+
+    # Format of NumPy arrays of 8-bit values, by values per pixel
+    _formats = {
+        1: QtGui.QImage.Format_Grayscale8,
+        3: QtGui.QImage.Format_RGB888,
+        4: QtGui.QImage.Format_RGBA8888,
+    }
+
+    def __init__(self,
+                 data,
+                 width,
+                 height,
+                 format=QtGui.QImage.Format_RGBA8888,
+                 bytesPerLine=None):
+
+        if bytesPerLine is None:
+            depth = QtGui.QImage.toPixelFormat(format).bitsPerPixel()
+            bytesPerLine = (width * depth + 7) // 8
+
+        # Referring to, rather than copying, pixels of `data`
+        # which is kept alongside it
+        self.data = data
+        self.image = QtGui.QImage(data, width, height, bytesPerLine, format)
+
+    @classmethod
+    def fromArray(cls, array):
+        """Return buffer of NumPy `array`, of shape (height, width[, values])
+
+        Arrays are of 8-bit values, 1 for grayscale, 3 for RGB or 4 for
+        RGBA per pixel, and are copied unless each line is contiguous.
+
+        """
+
+        if array.dtype.itemsize != 1 or array.ndim not in (2, 3):
+            raise ValueError(
+                "Expected an array of 8-bit values, of 2 or 3 dimensions, "
+                "not %s of shape %s" % (array.dtype, array.shape)
+            )
+
+        height, width = array.shape[:2]
+        values = array.shape[2] if array.ndim == 3 else 1
+
+        try:
+            format = cls._formats[values]
+        except KeyError:
+            raise ValueError(
+                "Expected 1, 3 or 4 values per pixel, not %d" % values
+            )
+
+        if array.strides[1:] != (values, 1)[:array.ndim - 1] or (
+                array.strides[0] < width * values):
+            array = array.copy(order="C")
+
+        return cls(array, width, height, format, array.strides[0])
+
+    # Optional PEP08 syntax
+    from_array = fromArray
+
+
+def _image_buffer(value):
+    """Return `value` as an ImageBuffer, or None if not of pixels"""
+    if isinstance(value, ImageBuffer):
+        return value
+
+    if type(value).__module__ == "numpy":
+        return ImageBuffer.fromArray(value)
+
+    return None
+
+
+class _ImageLabel(QtWidgets.QLabel):
+    """A label also painting an ImageBuffer, scaled to fit
+
+    Pixels of the buffer are painted as they are, rather than first
+    being converted into a pixmap.
+
+    """
+
+    def __init__(self, parent=None):
+        super(_ImageLabel, self).__init__(parent)
+        self._buffer = None
+
+    def setBuffer(self, buffer):
+        if buffer is not None:
+            self.clear()
+
+        self._buffer = buffer
+        self.update()
+
+    def paintEvent(self, event):
+        if self._buffer is None:
+            return super(_ImageLabel, self).paintEvent(event)
+
+        image = self._buffer.image
+        rect = QtCore.QRect(
+            QtCore.QPoint(),
+            image.size().scaled(self.size(), QtCore.Qt.KeepAspectRatio)
+        )
+        rect.moveCenter(self.rect().center())
+
+        painter = QtGui.QPainter(self)
+        painter.drawImage(rect, image)
+
+
+class _ImageJobSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)  # _ImageJob
+
+
+class _ImageJob(QtCore.QRunnable):
+    """Read an image, by `read(*args)`, such as `_read_image()`"""
+
+    def __init__(self, read, *args):
+        super(_ImageJob, self).__init__()
+        self.setAutoDelete(False)
+
+        self.read = read
+        self.args = args
+        self.image = None
+
+        self.cancelled = False
+        self.signals = _ImageJobSignals()
+
+    def run(self):
+        try:
+            if not self.cancelled:
+                self.image = self.read(*self.args)
+        finally:
+            # Also once cancelled, for the loader to let go of this job
+            self.signals.finished.emit(self)
+
+
+class _ImageLoader(QtCore.QObject):
+    """Read images in a pool of threads, of which only the latest is kept
+
+    Images requested before the latest are cancelled, if not yet begun,
+    and discarded otherwise.
 
-        return container
+    """
 
-    def read(self, role=QtCore.Qt.DisplayRole):
-        return self._read(role)
+    loaded = QtCore.Signal(object)  # QImage, null if it couldn't be read
 
-    def reset(self, items=None, header=None, current=None):
-        self["items"][:] = items or []
-        self._reset(items, header, current)
+    # Shared by every loader, such as to not read too many files at once
+    _pool = None
+    _running = set()  # Kept alive until done, even if cancelled
 
-    def setHeader(self, *columns):
-        header = self._widget.headerItem()
-        for index, label in enumerate(columns):
-            header.setText(index, label)
+    # Threads reading images at once
+    maxThreadCount = 4
 
-        if columns:
-            self._widget.setHeaderHidden(True)
-        else:
-            self._widget.setHeaderHidden(False)
+    def __init__(self, parent=None):
+        super(_ImageLoader, self).__init__(parent)
+        self._job = None
 
-    def onItemChanged(self, current, previous):
-        # Give selection model a chance to update its selection
-        QtCore.QTimer.singleShot(10, self.changed.emit)
+    def load(self, path, size, read=_read_image):
+        """Read image at `path` scaled down to `size`, emitting `loaded`
 
-    def onItemDoubleClicked(self):
-        def emit():
-            self.doubleClicked.emit()
+        Arguments:
+            path (str): Path to image
+            size (QSize): Size to fit the image within
+            read (callable, optional): Return image of `path` and `size`,
+                called in a thread of the pool
 
-        # Give widget a chance to render
-        QtCore.QTimer.singleShot(10, emit)
+        """
 
+        self.cancel()
 
-class Separator(QArgument):
-    """Visual separator
+        if _ImageLoader._pool is None:
+            pool = QtCore.QThreadPool()
+            pool.setMaxThreadCount(min(
+                _ImageLoader.maxThreadCount, QtCore.QThread.idealThreadCount()
+            ))
+            _ImageLoader._pool = pool
 
-    Example:
+        job = _ImageJob(read, path, size)
 
-        item1
-        item2
-        ------------
-        item3
-        item4
+        # Let go of the job, even if this loader is deleted before it's done
+        job.signals.finished.connect(self._running.discard)
+        job.signals.finished.connect(self._onFinished)
 
-    """
+        self._job = job
+        self._running.add(job)
+        self._pool.start(job)
 
-    def __init__(self, name, **kwargs):
-        super(Separator, self).__init__(name, **kwargs)
-        self._data["editable"] = False
+    def cancel(self):
+        """Discard the image being read, if any"""
+        job, self._job = self._job, None
 
-    def create(self):
-        widget = _with_entered_exited(QtWidgets.QWidget, self)()
+        if job is None:
+            return
 
-        self._read = lambda: None
-        self._write = lambda value: None
+        job.cancelled = True
 
-        return widget
+        if self._pool.tryTake(job):
+            self._running.discard(job)  # Never to be run
 
-    def reset(self):
-        # This ain't got no default value
-        pass
+    def _onFinished(self, job):
+        if job is not self._job or job.cancelled:
+            return  # Overtaken
+
+        self._job = None
+        self.loaded.emit(job.image)
 
 
 class Image(QArgument):
@@ -1503,22 +3908,54 @@ class Image(QArgument):
               |                |
               |________________|
 
+    Images written by path are read in a thread of their own, scaled down
+    to fit the widget, with a placeholder shown meanwhile. Pixels may
+    also be written as an `ImageBuffer` or NumPy array, shown without
+    copying them.
+
     """
 
     clicked = QtCore.Signal()
 
+    _written = None  # Path, pixmap or pixels, given by `create()`
+
     def __init__(self, name, **kwargs):
         super(Image, self).__init__(name, **kwargs)
         self._data["editable"] = False
 
     def create(self):
-        label = _with_entered_exited(QtWidgets.QLabel, self)()
+        label = _with_entered_exited(_ImageLabel, self)()
         label.setMinimumHeight(px(200))
         label.setMinimumWidth(px(128))
+        label.setAlignment(QtCore.Qt.AlignCenter)
+
+        loader = _ImageLoader(label)
+        loader.loaded.connect(
+            lambda image: label.setPixmap(QtGui.QPixmap.fromImage(image))
+        )
 
         self._widget = label
 
         def _write(pixmap):
+            self._written = pixmap
+            buffer = _image_buffer(pixmap)
+
+            if buffer is not None:
+                loader.cancel()
+                label.setBuffer(buffer)
+                return
+
+            label.setBuffer(None)
+
+            if isinstance(pixmap, _basestring):
+                label.setText("Loading..")
+                loader.load(
+                    pixmap, label.size().expandedTo(label.minimumSize())
+                )
+                return
+
+            loader.cancel()
+
             if not isinstance(pixmap, QtGui.QPixmap):
                 pixmap = QtGui.QPixmap(pixmap)
             label.setPixmap(pixmap)
@@ -1531,7 +3968,7 @@ class Image(QArgument):
         if initial is None:
             initial = self["default"]
 
-        if initial != self.default:
+        if initial is not None:
             self._write(initial)
 
         return label
@@ -1540,10 +3977,20 @@ class Image(QArgument):
         # This ain't got no default value
         pass
 
+    def _detach(self):
+        # Kept as written, as the widget is read as None
+        written = self._written
+        super(Image, self)._detach()
+
+        self._value = written
+        self._written = None
+
 
 # For whatever reason, sizeHint of a QPushButton doesn't
 # respect the minimum of fixed sizes. :/
 class _ImageButton(QtWidgets.QPushButton):
+    shown = None  # Cache key of image shown, if read from a path
+
     def sizeHint(self):
         return QtCore.QSize(px(200), px(128))
 
@@ -1558,10 +4005,20 @@ class ImageButton(QArgument):
               |                |
               |________________|
 
+    Images written by path are read in a thread of their own, scaled down
+    to fit the button, with a placeholder shown meanwhile. Thumbnails are
+    kept by `ImageButton.thumbnails`, shared by every button, or read
+    anew each time if None. Pixels may also be written as an
+    `ImageBuffer` or NumPy array.
+
     """
 
     clicked = QtCore.Signal()
 
+    _written = None  # Path, pixmap or pixels, given by `create()`
+
+    thumbnails = ThumbnailCache()
+
     def __init__(self, name, **kwargs):
         super(ImageButton, self).__init__(name, **kwargs)
         self._data["editable"] = False  # No reset button
@@ -1575,30 +4032,82 @@ class ImageButton(QArgument):
 
         button.clicked.connect(self.clicked.emit)
 
+        def on_loaded(image):
+            button.setText("")
+
+            # Shown already, from memory
+            if image.cacheKey() == button.shown:
+                return
+
+            button.shown = image.cacheKey()
+            button.setIcon(QtGui.QIcon(QtGui.QPixmap.fromImage(image)))
+
+        loader = _ImageLoader(button)
+        loader.loaded.connect(on_loaded)
+
         def _write(pixmap):
-            if isinstance(pixmap, QtGui.QIcon):
-                pass
+            self._written = pixmap
 
-            elif isinstance(pixmap, QtGui.QPixmap):
-                pixmap.scaled(
-                    px(200), px(128),
-                    QtCore.Qt.KeepAspectRatio,
-                    QtCore.Qt.SmoothTransformation
-                )
-                icon = QtGui.QIcon(pixmap)
+            if isinstance(pixmap, _basestring):
+                return write_path(pixmap)
+
+            loader.cancel()
+            button.setText("")
+            button.shown = None
+
+            buffer = _image_buffer(pixmap)
+
+            if isinstance(pixmap, QtGui.QIcon):
+                icon = pixmap
+
+            elif buffer is not None:
+                # Scaled straight from its pixels, copying only those shown
+                icon = QtGui.QIcon(QtGui.QPixmap.fromImage(
+                    buffer.image.scaled(
+                        size,
+                        QtCore.Qt.KeepAspectRatio,
+                        QtCore.Qt.SmoothTransformation
+                    )
+                ))
 
             else:
                 # Try making whatever this is into a pixmap
-                pixmap = QtGui.QPixmap(pixmap)
-                pixmap.scaled(
-                    px(200), px(128),
-                    QtCore.Qt.KeepAspectRatio,
-                    QtCore.Qt.SmoothTransformation
-                )
+                if not isinstance(pixmap, QtGui.QPixmap):
+                    pixmap = QtGui.QPixmap(pixmap)
+
+                if not pixmap.isNull():
+                    pixmap = pixmap.scaled(
+                        size,
+                        QtCore.Qt.KeepAspectRatio,
+                        QtCore.Qt.SmoothTransformation
+                    )
+
                 icon = QtGui.QIcon(pixmap)
 
             button.setIcon(icon)
 
+        def write_path(path):
+            thumbnails = self.thumbnails
+            image = None
+
+            if thumbnails is None:
+                read = _read_image
+
+            else:
+                # Shown right away, and replaced once read if modified since
+                image = thumbnails.get(path, size)
+                read = thumbnails.read
+
+            if image is not None:
+                on_loaded(image)
+
+            else:
+                button.shown = None
+                button.setIcon(QtGui.QIcon())
+                button.setText("Loading..")
+
+            loader.load(path, size, read)
+
         self._widget = button
         self._read = lambda: None
         self._write = _write
@@ -1622,6 +4131,14 @@ class ImageButton(QArgument):
         # This ain't got no default value
         pass
 
+    def _detach(self):
+        # Kept as written, as the widget is read as None
+        written = self._written
+        super(ImageButton, self)._detach()
+
+        self._value = written
+        self._written = None
+
 
 class Enum(QArgument):
     """Argument user interface for selecting one from dropdown list
@@ -1636,25 +4153,49 @@ class Enum(QArgument):
         default (int, str, optional): Index or text of default item, use first
             of `items` if not given.
         enabled (bool, optional): Whether to enable this widget, default True
+        lazy (bool, optional): For many items, fetch `items` from any
+            iterator as they are scrolled to or looked up, and jump to
+            items by typing the beginning of their name
 
     """
 
+    _model = None  # Given by `create()`, when lazy
+    _source = None  # Iterator of items yet to be fetched, when lazy
+
+    # Number of items fetched at a time, when lazy
+    fetchSize = 200
+
     def __init__(self, name, **kwargs):
         kwargs["items"] = kwargs.get("items", ["Default"])
-        kwargs["default"] = kwargs.pop("default", 0)
+        lazy = kwargs.pop("lazy", False)
+
+        # Also when passed as None, such as by `addArgument()`
+        if kwargs.get("default") is None:
+            kwargs["default"] = 0
 
         _enum_types = (tuple, list, types.GeneratorType)
-        assert isinstance(kwargs["items"], _enum_types), (
+        assert lazy or isinstance(kwargs["items"], _enum_types), (
             "items must be list, tuple or generator"
         )
 
         super(Enum, self).__init__(name, **kwargs)
 
+        self["lazy"] = lazy
+
+        if lazy and not isinstance(self["items"], list):
+            self._source = iter(self["items"])
+            self["items"] = []
+
     def create(self, fillWidth=True):
-        items = self["items"] = list(self["items"])  # eval generator
+        items = self._items()
 
         widget = _with_entered_exited(QtWidgets.QComboBox, self)()
-        widget.addItems(items)
+
+        if self["lazy"]:
+            self._createLazy(widget)
+        else:
+            widget.addItems(items)
+
         widget.currentIndexChanged.connect(
             lambda index: self.changed.emit())
 
@@ -1671,78 +4212,462 @@ class Enum(QArgument):
                                  QtWidgets.QSizePolicy.Fixed)
             layout.addWidget(widget, 1, QtCore.Qt.AlignLeft)
 
-        self._read = widget.currentIndex
-        self.text = widget.itemText
+        self._read = widget.currentIndex
+        self.text = widget.itemText
+
+        def _write(value):
+            index = None
+
+            # Support passing an index directly
+            if isinstance(value, (float, int)):
+                index = int(value)
+
+            else:
+                index = self._itemIndex(value)
+
+            # Be forgiving, as it isn't easy handling an
+            # error happening at this level
+            if index is None:
+                self._logNotAnOption(value)
+                index = 0
+
+            widget.setCurrentIndex(index)
+
+        self._write = _write
+
+        # Falls back to the first item, if not an option
+        self._write(self._initial())
+
+        return widget if fillWidth else container
+
+    def _createLazy(self, widget):
+        """Present items by a model, rather than one QStandardItem each"""
+
+        # Type-ahead below, rather than by its own completer and lookup,
+        # which compare every item
+        widget.setEditable(True)
+        widget.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
+        widget.setCompleter(None)
+        widget.setDuplicatesEnabled(True)
+
+        model = _ItemsModel(self["items"], widget)
+        widget.setModel(model)
+
+        # Rows are single lines of text, spare the popup and combobox
+        # from measuring each of them
+        widget.view().setUniformItemSizes(True)
+        widget.setSizeAdjustPolicy(
+            QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon
+        )
+        widget.setMinimumContentsLength(20)
+
+        if self._source is not None:
+            model.setFetch(lambda: self._fetch(self.fetchSize))
+
+        self._model = model
+
+        # Type-ahead, by a popup of items starting with what is typed
+        matches = QtCore.QStringListModel(widget)
+        completer = QtWidgets.QCompleter(matches, widget)
+        completer.setCompletionMode(
+            QtWidgets.QCompleter.UnfilteredPopupCompletion
+        )
+        completer.setWidget(widget.lineEdit())
+
+        # Of items fetched so far, see `_PrefixIndex`
+        prefixes = _PrefixIndex()
+        limit = 50  # Items shown at once
+
+        def search(text):
+            items = self["items"]
+            prefixes.extend(items[len(prefixes):])
+            return prefixes.search(text, limit)
+
+        def on_edited(text):
+            indexes = search(text)
+
+            # Fetch more on each keystroke, rather than every item at once
+            if len(indexes) < limit and self._source is not None:
+                self._fetch(self.fetchSize)
+                indexes = search(text)
+
+            items = self["items"]
+            matches.setStringList([items[index] for index in indexes])
+
+            if text and matches.rowCount():
+                completer.complete()
+            else:
+                completer.popup().hide()
+
+        def on_finished():
+            # Of items fetched so far, rather than fetching every item
+            # in search of text which may not be an item at all
+            text = widget.lineEdit().text()
+            index = super(Enum, self)._itemIndex(text)
+
+            if index is None:
+                index = widget.currentIndex()
+                widget.lineEdit().setText(widget.itemText(index))
+
+            widget.setCurrentIndex(index)
+
+        def on_activated(text):
+            index = super(Enum, self)._itemIndex(text)
+
+            if index is not None:
+                widget.setCurrentIndex(index)
+
+        widget.lineEdit().textEdited.connect(on_edited)
+        widget.lineEdit().editingFinished.connect(on_finished)
+        completer.activated[str].connect(on_activated)
+
+    def _fetch(self, count=None):
+        """Append `count` items from those not yet fetched, or every item"""
+        if self._source is None:
+            return
+
+        if count is None:
+            items = list(self._source)
+        else:
+            items = list(itertools.islice(self._source, count))
+
+        if count is None or len(items) < count:
+            self._source = None
+
+            if self._model is not None:
+                self._model.setFetch(None)
+
+        if self._model is not None:
+            self._model.extend(items)
+        else:
+            self["items"].extend(items)
+
+    def _items(self):
+        items = self["items"]
+
+        if not isinstance(items, list):
+            items = self["items"] = list(items)  # eval generator
+
+        return items
+
+    def _itemIndex(self, value):
+        index = super(Enum, self)._itemIndex(value)
+
+        # Not fetched yet, perhaps
+        while index is None and self._source is not None:
+            self._fetch(self.fetchSize)
+            index = super(Enum, self)._itemIndex(value)
+
+        return index
+
+    def _detach(self):
+        super(Enum, self)._detach()
+
+        # Deleted alongside its widget
+        self._model = None
+
+    def coerce(self, value):
+        """Return index of `value`, which is either an index or an item"""
+        items = self._items()
+
+        # Support passing an index directly
+        if isinstance(value, (float, int)):
+            index = int(value)
+
+            # Not fetched yet, perhaps
+            if index >= len(items):
+                self._fetch(index + 1 - len(items))
+
+            if 0 <= index < len(items):
+                return index
+
+        else:
+            index = self._itemIndex(value)
+
+            if index is not None:
+                return index
+
+            # An index stored as string, e.g. by QSettings(..IniFormat)
+            if isinstance(value, _basestring) and value.isdigit():
+                index = int(value)
+
+                if index < len(items):
+                    return index
+
+        # Be forgiving, as it isn't easy handling an
+        # error happening at this level
+        self._logNotAnOption(value)
+
+        return 0
+
+    def _logNotAnOption(self, value):
+        # Listing every item is costly, for many items
+        if not _log.isEnabledFor(logging.INFO):
+            return
+
+        _log.info(
+            "%r isn't an option for '%s', whose options are '%s'" % (
+
+                # Help the caller understand why this is happening
+                value, self["name"], "', '".join(
+                    str(i) for i in self["items"]
+                )
+            )
+        )
+
+    def encode(self, value):
+        # Store the item, such that reordering items keeps the choice
+        items = self["items"]
+        return items[value] if 0 <= value < len(items) else value
+
+    def isEdited(self):
+        # Account for string defaults
+        return self.read() != self.coerce(self["default"])
+
+    def compose_reset_tip(self):
+        default = self["default"]
+        if isinstance(default, int):
+            default = self["items"][default]
+        return "Reset to %s" % default
+
+
+class _ItemsModel(QtCore.QAbstractListModel):
+    """Items of a list, of which more may be fetched as they are scrolled to
+
+    The list is shared with whoever passed it in, such as an `Enum`.
+
+    """
+
+    def __init__(self, items, parent=None):
+        super(_ItemsModel, self).__init__(parent)
+
+        self._items = items
+        self._fetch = None
+
+    def setFetch(self, fetch):
+        """Call `fetch()` for more items, until given None"""
+        self._fetch = fetch
+
+    def canFetchMore(self, parent):
+        return self._fetch is not None and not parent.isValid()
+
+    def fetchMore(self, parent):
+        if self._fetch is not None and not parent.isValid():
+            self._fetch()
+
+    def extend(self, items):
+        if not items:
+            return
+
+        row = len(self._items)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(items) - 1)
+        self._items.extend(items)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._items[index.row()]
+
+
+class _LinesModel(QtCore.QStringListModel):
+    """Lines, of which at most `maxlen` are kept, appended in batches
+
+    Lines appended are shown together, once control returns to the event
+    loop, removing those beyond `maxlen` from the beginning in one go.
+
+    Lines are kept by `_lines` rather than by the model itself, which
+    keeps as many empty rows. Such that lines are filled in before rows
+    are inserted, with views told of them once, rather than per line,
+    whilst rows remain counted and laid out without calling on Python.
+
+    """
+
+    aboutToFlush = QtCore.Signal()
+    flushed = QtCore.Signal()
+
+    def __init__(self, maxlen=None, parent=None):
+        super(_LinesModel, self).__init__(parent)
+
+        self._maxlen = maxlen
+        self._lines = []  # One per row
+        self._pending = []
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._lines[index.row()]
+
+        return None
+
+    def lines(self):
+        self.flush()
+        return list(self._lines)
+
+    def reset(self, lines):
+        self._pending = []
+
+        if self._maxlen is not None:
+            lines = lines[-self._maxlen:] if self._maxlen else []
+
+        self._lines = list(lines)
+        self.setStringList([""] * len(self._lines))
+
+    def extend(self, lines):
+        self._pending.extend(lines)
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Show lines appended, right away"""
+        self._timer.stop()
+        lines, self._pending = self._pending, []
+
+        if not lines:
+            return
+
+        self.aboutToFlush.emit()
+
+        if self._maxlen is not None:
+            lines = lines[-self._maxlen:] if self._maxlen else []
+            overflow = len(self._lines) + len(lines) - self._maxlen
+
+            if overflow > 0:
+                self.removeRows(0, overflow)
+                del self._lines[:overflow]
+
+        if lines:
+            row = len(self._lines)
+            self._lines.extend(lines)
+            self.insertRows(row, len(lines))
+
+        self.flushed.emit()
+
+
+class _PrefixIndex(object):
+    """Indexes of items by the beginning of their name, regardless of case
+
+    Items may be indexed as they are fetched, following those indexed
+    so far.
+
+    """
+
+    def __init__(self, items=()):
+        self._keys = []
+        self._count = 0
+        self.extend(items)
+
+    def __len__(self):
+        return self._count
+
+    def extend(self, items):
+        """Index `items`, following those indexed so far"""
+        keys = sorted(
+            (str(item).lower(), self._count + offset)
+            for offset, item in enumerate(items)
+        )
+
+        if not keys:
+            return
+
+        # Merged rather than sorted anew, as both are sorted already
+        self._keys.extend(keys)
+        self._keys.sort()
+        self._count += len(keys)
+
+    def search(self, prefix, limit=50):
+        """Return indexes of up to `limit` items starting with `prefix`"""
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._keys, (prefix,))
+        indexes = []
+
+        for key, index in self._keys[start:start + limit]:
+            if not key.startswith(prefix):
+                break
 
-        def _write(value):
-            index = None
+            indexes.append(index)
 
-            # Support passing an index directly
-            if isinstance(value, (float, int)):
-                index = int(value)
+        return indexes
 
-            else:
-                for idx, val in enumerate(items):
-                    if value == val:
-                        index = idx
-                        break
 
-            # Be forgiving, as it isn't easy handling an
-            # error happening at this level
-            if index is None:
-                _log.info(
-                    "%r isn't an option for '%s', whose options are '%s'" % (
+class _TextIndex(object):
+    """Indexes of items by any part of their name, regardless of case
 
-                        # Help the caller understand why this is happening
-                        value, self["name"], "', '".join(
-                            str(i) for i in self["items"]
-                        )
-                    )
-                )
+    Names are also joined into one string, such that the few items
+    containing a word are found by `str.find()` without comparing every
+    name in turn.
 
-                index = 0
+    """
 
-            widget.setCurrentIndex(index)
+    def __init__(self, items):
+        self._names = [
+            str(item).lower().replace("\0", " ") for item in items
+        ]
+        self._text = "\0".join(self._names) + "\0"
+        self._starts = array.array("l")
 
-        self._write = _write
+        start = 0
+        for name in self._names:
+            self._starts.append(start)
+            start += len(name) + 1
 
-        initial = self["initial"]
+    def search(self, text):
+        """Return ascending indexes of items containing every word of `text`"""
+        words = text.lower().replace("\0", " ").split()
 
-        if initial is None:
-            initial = self["default"]
+        if not words:
+            return []
 
-        if initial is not None:
-            if isinstance(initial, int):
-                index = initial
-                index = 0 if index > len(items) else index
+        # The longest word matches fewest items, check others against those
+        words.sort(key=len, reverse=True)
+        first, others = words[0], words[1:]
 
-                try:
-                    initial = items[index]
-                except IndexError:
-                    initial = ""
-            else:
-                # Must be str type. If the default str is not in list, will
-                # fallback to the first item silently.
-                pass
+        if self._text.count(first) > len(self._names) // 8:
+            # Most items match, comparing each is quicker than finding each
+            indexes = [
+                index for index, name in enumerate(self._names)
+                if first in name
+            ]
 
-            self._write(initial)
+        else:
+            indexes = self._find(first)
 
-        return widget if fillWidth else container
+        if others:
+            names = self._names
+            indexes = [
+                index for index in indexes
+                if all(word in names[index] for word in others)
+            ]
 
-    def isEdited(self):
-        default = self["default"]
+        return indexes
 
-        # Account for string defaults
-        if isinstance(default, _basestring):
-            default = self["items"].index(self["default"])
+    def _find(self, word):
+        starts = self._starts
+        find = self._text.find
+        indexes = []
 
-        return self.read() != default
+        position = find(word)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            indexes.append(index)
 
-    def compose_reset_tip(self):
-        default = self["default"]
-        if isinstance(default, int):
-            default = self["items"][default]
-        return "Reset to %s" % default
+            # Continue from the next item, for one index per item
+            try:
+                position = find(word, starts[index + 1])
+            except IndexError:
+                break
+
+        return indexes
 
 
 def camelToTitle(text):
@@ -1793,6 +4718,9 @@ class GenericTreeModel(QtCore.QAbstractItemModel):
     def __init__(self, parent=None):
         super(GenericTreeModel, self).__init__(parent)
 
+        # Called for more rows as the view is scrolled to the end
+        self._fetch = None
+
         self._rootItem = GenericTreeModelItem()
 
     def reset(self, root, current=None):
@@ -1830,6 +4758,65 @@ class GenericTreeModel(QtCore.QAbstractItemModel):
         except (KeyError, IndexError):
             pass
 
+    def setFetch(self, fetch):
+        """Call `fetch()` for more rows, until given None"""
+        self._fetch = fetch
+
+    def canFetchMore(self, parent):
+        return self._fetch is not None and not parent.isValid()
+
+    def fetchMore(self, parent):
+        if self._fetch is not None and not parent.isValid():
+            self._fetch()
+
+    def insertItems(self, row, items):
+        """Insert rows of `items`, as passed to `GenericTreeModelItem`"""
+        if not items:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(items) - 1)
+        self._rootItem.insertChildren(row, [
+            GenericTreeModelItem(item) for item in items
+        ])
+        self.endInsertRows()
+
+    def removeItems(self, row, count):
+        if count < 1:
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row + count - 1)
+        self._rootItem.removeChildren(row, count)
+        self.endRemoveRows()
+
+    def updateItems(self, row, items):
+        """Replace data of rows from `row` onwards with `items`"""
+        if not items:
+            return
+
+        for offset, item in enumerate(items):
+            self._rootItem.child(row + offset)._data = item
+
+        self.dataChanged.emit(
+            self.index(row, 0),
+            self.index(row + len(items) - 1, self.columnCount() - 1),
+        )
+
+    def columnValues(self, column):
+        """Return the display value of each row of `column`"""
+        values = []
+
+        for item in self._rootItem._children:
+            value = item.data(QtCore.Qt.DisplayRole)
+
+            if isinstance(value, (tuple, list)):
+                value = value[column] if column < len(value) else None
+            elif column > 0:
+                value = None
+
+            values.append(value)
+
+        return values
+
     def headerData(self, section, orientation, role):
         if role != QtCore.Qt.DisplayRole:
             return None
@@ -1879,6 +4866,574 @@ class GenericTreeModel(QtCore.QAbstractItemModel):
         return len(self._rootItem.data(QtCore.Qt.DisplayRole))
 
 
+class GenericTableModel(QtCore.QAbstractTableModel):
+    """A table model of columns, rather than items
+
+    Each column is a sequence of the display value of each row, such as
+    a `list`, an `array.array` or a `_NumpyColumn`. Rows are indexes into
+    these, such that there is no object per row. Columns are changed in
+    place, and are shared with whoever passed them in.
+
+    """
+
+    def __init__(self, parent=None):
+        super(GenericTableModel, self).__init__(parent)
+
+        # Called for more rows as the view is scrolled to the end
+        self._fetch = None
+
+        self._columns = []
+
+    def reset(self, columns):
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
+    def setFetch(self, fetch):
+        """Call `fetch()` for more rows, until given None"""
+        self._fetch = fetch
+
+    def canFetchMore(self, parent):
+        return self._fetch is not None and not parent.isValid()
+
+    def fetchMore(self, parent):
+        if self._fetch is not None and not parent.isValid():
+            self._fetch()
+
+    def resetItems(self, items):
+        """Replace values of every column with those of rows of `items`"""
+        self.beginResetModel()
+        _remove_column_rows(self._columns, 0, self.rowCount())
+        _insert_column_rows(self._columns, 0, items)
+        self.endResetModel()
+
+    def insertItems(self, row, items):
+        if not items:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(items) - 1)
+        _insert_column_rows(self._columns, row, items)
+        self.endInsertRows()
+
+    def removeItems(self, row, count):
+        if count < 1:
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row + count - 1)
+        _remove_column_rows(self._columns, row, count)
+        self.endRemoveRows()
+
+    def updateItems(self, row, items):
+        if not items:
+            return
+
+        _update_column_rows(self._columns, row, items)
+        self.dataChanged.emit(
+            self.index(row, 0),
+            self.index(row + len(items) - 1, self.columnCount() - 1),
+        )
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole:
+            return self._columns[index.column()][index.row()]
+
+    def columnValues(self, column):
+        """Return the display value of each row of `column`"""
+        return list(self._columns[column])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not self._columns:
+            return 0
+
+        return len(self._columns[0])
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self._columns)
+
+
+class GenericListModel(QtCore.QAbstractListModel):
+    """A list model of roles, rather than items
+
+    Values of each role are stored in a list of their own, with None for
+    items without that role, such that there is no object per item.
+
+    """
+
+    def __init__(self, parent=None):
+        super(GenericListModel, self).__init__(parent)
+
+        self._roles = {}
+        self._count = 0
+
+    def reset(self, items):
+        """Replace every item with `items`, dictionaries of role and value"""
+        self.beginResetModel()
+        self._roles = {}
+        self._count = 0
+        self._append(items)
+        self.endResetModel()
+
+    def extend(self, items):
+        """Append `items`, dictionaries of role and value"""
+        if not items:
+            return
+
+        row = self._count
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(items) - 1)
+        self._append(items)
+        self.endInsertRows()
+
+    def _append(self, items):
+        roles = set().union(*items)
+
+        for role in roles:
+            values = self._roles.get(role)
+
+            if values is None:
+                values = self._roles[role] = [None] * self._count
+
+            values.extend([item.get(role) for item in items])
+
+        for role, values in self._roles.items():
+            if role not in roles:
+                values.extend([None] * len(items))
+
+        self._count += len(items)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.EditRole:
+            role = QtCore.Qt.DisplayRole
+
+        values = self._roles.get(role)
+
+        if values is not None:
+            return values[index.row()]
+
+    def setData(self, index, value, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.EditRole:
+            role = QtCore.Qt.DisplayRole
+
+        if role not in self._roles:
+            self._roles[role] = [None] * self._count
+
+        self._roles[role][index.row()] = value
+        self.dataChanged.emit(index, index)
+
+        return True
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self._count
+
+
+class GenericProxyModel(QtCore.QAbstractTableModel):
+    """Rows of a flat model, sorted and filtered outside of the GUI thread
+
+    Display values of each column are read once, after which sort keys
+    and text to filter by are computed in a thread of their own. The
+    rows found are applied in a single change of layout, and jobs
+    overtaken by newer ones are cancelled.
+
+    Rather than a QAbstractProxyModel, indexes are those of a table,
+    sparing views from calling into Python for each row they lay out.
+
+    """
+
+    def __init__(self, parent=None):
+        super(GenericProxyModel, self).__init__(parent)
+
+        self._source = None
+        self._rows = []  # Source row of each row
+        self._positions = []  # Row of each source row, or -1 if filtered
+
+        self._column = -1  # Column sorted by, or -1 for source order
+        self._order = QtCore.Qt.AscendingOrder
+        self._terms = []
+
+        # Read from the source model, and computed by jobs, on demand
+        self._values = {}
+        self._keys = {}
+        self._text = None
+        self._generation = 0  # Incremented as the source model changes
+
+        self._job = None
+        self._running = set()  # Kept alive until done, even if cancelled
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def sourceModel(self):
+        return self._source
+
+    def setSourceModel(self, model):
+        # Paired with `endResetModel()` by `_onReset()`
+        self.beginResetModel()
+
+        previous, self._source = self._source, model
+
+        if previous is not None:
+            previous.modelAboutToBeReset.disconnect(self.beginResetModel)
+            previous.modelReset.disconnect(self._onReset)
+            previous.rowsInserted.disconnect(self._onRowsInserted)
+            previous.rowsRemoved.disconnect(self._onRowsRemoved)
+            previous.dataChanged.disconnect(self._onDataChanged)
+
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._onReset)
+        model.rowsInserted.connect(self._onRowsInserted)
+        model.rowsRemoved.connect(self._onRowsRemoved)
+        model.dataChanged.connect(self._onDataChanged)
+
+        self._onReset()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self._column = column
+        self._order = order
+        self._schedule()
+
+    def setFilter(self, text):
+        """Show only rows containing every word of `text`, in any column"""
+        self._terms = text.lower().split()
+        self._schedule()
+
+    def isPending(self):
+        """Is a job yet to apply its rows?"""
+        return self._job is not None
+
+    def _schedule(self):
+        if self._job is not None:
+            self._job.cancelled = True
+            self._job = None
+
+        source = self.sourceModel()
+        count = source.rowCount()
+
+        if self._column < 0 and not self._terms:
+            return self._setRows(list(range(count)))
+
+        columns = range(source.columnCount())
+        job = _ProxyJob(
+            generation=self._generation,
+            count=count,
+            values=dict((c, self._columnValues(c)) for c in columns),
+            column=self._column,
+            keys=self._keys.get(self._column),
+            descending=self._order == QtCore.Qt.DescendingOrder,
+            terms=self._terms,
+            text=self._text,
+        )
+
+        job.signals.finished.connect(self._onFinished)
+        self._job = job
+        self._running.add(job)
+        self._pool.start(job)
+
+    def _columnValues(self, column):
+        try:
+            return self._values[column]
+        except KeyError:
+            values = self.sourceModel().columnValues(column)
+            self._values[column] = values
+            return values
+
+    def _onFinished(self, job):
+        self._running.discard(job)
+
+        if job is not self._job or job.cancelled:
+            return  # Overtaken
+
+        self._job = None
+
+        if job.generation != self._generation:
+            return self._schedule()  # Rows changed whilst sorting
+
+        # Keep what was computed for the next job
+        if job.column >= 0:
+            self._keys[job.column] = job.keys
+
+        if job.text is not None:
+            self._text = job.text
+
+        self._setRows(job.rows)
+
+    def _setRows(self, rows, translate=None):
+        """Replace rows, moving those which remain in a single change of layout
+
+        A change of layout may not change the number of rows, such that
+        rows are first inserted at the end, and rows no longer shown are
+        removed from the end once moved there.
+
+        Arguments:
+            rows (list): Source row of each row
+            translate (callable, optional): Return the source row of a
+                prior source row, or -1 if removed
+
+        """
+
+        parent = QtCore.QModelIndex()
+
+        if translate is not None:
+            self._rows = [translate(source) for source in self._rows]
+
+            # Those of source rows removed
+            removed = [
+                row for row, source in enumerate(self._rows) if source < 0
+            ]
+
+            for first, last in reversed(_runs(removed)):
+                self.beginRemoveRows(parent, first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+
+        shown = set(self._rows)
+        added = [source for source in rows if source not in shown]
+
+        if added:
+            count = len(self._rows)
+            self.beginInsertRows(parent, count, count + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+
+        # Those no longer shown, at the end
+        kept = set(rows)
+        dropped = [source for source in self._rows if source not in kept]
+        order = list(rows) + dropped
+
+        if order != self._rows:
+            self.layoutAboutToBeChanged.emit()
+
+            before = self.persistentIndexList()
+            sources = [self._rows[index.row()] for index in before]
+
+            self._rows = order
+            self._updatePositions()
+
+            after = []
+            for index, source in zip(before, sources):
+                row = self._positions[source]
+                after.append(
+                    self.index(row, index.column())
+                    if row >= 0 else QtCore.QModelIndex()
+                )
+
+            self.changePersistentIndexList(before, after)
+            self.layoutChanged.emit()
+
+        if dropped:
+            self.beginRemoveRows(parent, len(rows), len(self._rows) - 1)
+            del self._rows[len(rows):]
+            self.endRemoveRows()
+
+        self._updatePositions()
+
+    def _updatePositions(self):
+        self._positions = [-1] * self.sourceModel().rowCount()
+        for row, source in enumerate(self._rows):
+            self._positions[source] = row
+
+    def _invalidate(self):
+        self._values.clear()
+        self._keys.clear()
+        self._text = None
+        self._generation += 1
+
+    def _onReset(self):
+        self._invalidate()
+        self._rows = list(range(self.sourceModel().rowCount()))
+        self._positions = list(self._rows)
+        self.endResetModel()
+
+        if self._column >= 0 or self._terms:
+            self._schedule()
+
+    def _onRowsInserted(self, parent, first, last):
+        self._invalidate()
+        count = last - first + 1
+
+        def translate(source):
+            return source + count if source >= first else source
+
+        rows = [translate(source) for source in self._rows]
+        rows.extend(range(first, last + 1))  # Sorted and filtered below
+        self._setRows(rows, translate)
+
+        if self._column >= 0 or self._terms:
+            self._schedule()
+
+    def _onRowsRemoved(self, parent, first, last):
+        self._invalidate()
+        count = last - first + 1
+
+        def translate(source):
+            if source > last:
+                return source - count
+            return source if source < first else -1
+
+        rows = [translate(source) for source in self._rows]
+        self._setRows([row for row in rows if row >= 0], translate)
+
+    def _onDataChanged(self, first, last, *args):
+        self._invalidate()
+
+        rows = [
+            self._positions[source]
+            for source in range(first.row(), last.row() + 1)
+            if self._positions[source] >= 0
+        ]
+
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), first.column()),
+                self.index(max(rows), last.column()),
+            )
+
+        if self._column >= 0 or self._terms:
+            self._schedule()
+
+    def mapToSource(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self._source.index(self._rows[index.row()], index.column())
+
+    def mapFromSource(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        row = self._positions[index.row()]
+
+        if row < 0:
+            return QtCore.QModelIndex()
+
+        return self.index(row, index.column())
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = self._rows[index.row()]
+
+        if row < 0:
+            return None  # Removed from source, and about to be here
+
+        source = self._source
+        return source.data(source.index(row, index.column()), role)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._source.columnCount()
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and bool(self._rows)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        return self._source.headerData(section, orientation, role)
+
+    def canFetchMore(self, parent):
+        return self._source.canFetchMore(QtCore.QModelIndex())
+
+    def fetchMore(self, parent):
+        self._source.fetchMore(QtCore.QModelIndex())
+
+
+class _ProxyJobSignals(QtCore.QObject):
+    finished = QtCore.Signal(object)  # _ProxyJob
+
+
+class _ProxyJob(QtCore.QRunnable):
+    """Sort and filter rows, given display values of each column
+
+    Sort keys and the text of each row to filter by are computed,
+    unless given, and kept for subsequent jobs.
+
+    """
+
+    def __init__(self,
+                 generation,
+                 count,
+                 values,
+                 column,
+                 keys,
+                 descending,
+                 terms,
+                 text):
+        super(_ProxyJob, self).__init__()
+        self.setAutoDelete(False)
+
+        self.generation = generation
+        self.count = count
+        self.values = values.get(column)
+        self.column = column
+        self.keys = keys
+        self.descending = descending
+        self.terms = terms
+        self.text = text
+        self.rows = None
+
+        self._columns = [values[c] for c in sorted(values)]
+        self.cancelled = False
+        self.signals = _ProxyJobSignals()
+
+    def run(self):
+        try:
+            self.rows = self._run()
+        finally:
+            # Also once cancelled, for the proxy to let go of this job
+            self.signals.finished.emit(self)
+
+    def _run(self):
+        rows = range(self.count)
+
+        if self.terms:
+            if self.text is None:
+                self.text = self._text()
+
+            if self.cancelled:
+                return None
+
+            text = self.text
+            rows = [
+                row for row in rows
+                if all(term in text[row] for term in self.terms)
+            ]
+
+        rows = list(rows)
+
+        if self.column >= 0 and not self.cancelled:
+            if self.keys is None:
+                self.keys = [_sort_key(value) for value in self.values]
+
+            rows.sort(key=self.keys.__getitem__, reverse=self.descending)
+
+        return rows
+
+    def _text(self):
+        text = []
+
+        for row, values in enumerate(zip(*self._columns)):
+            if row % 10000 == 0 and self.cancelled:
+                return None
+
+            text.append(
+                "\t".join(
+                    "" if value is None else str(value) for value in values
+                ).lower()
+            )
+
+        return text
+
+
+def _sort_key(value):
+    """Order numbers before text, and text regardless of case"""
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+
+    return (1, 0, "" if value is None else str(value).lower())
+
+
 class GenericTreeModelItem(object):
     """An item for the GenericTreeModel
 
@@ -1905,8 +5460,11 @@ class GenericTreeModelItem(object):
         self._children = list()
         self._parent = parent
 
+        # Position amongst children of parent, kept up to date by parent
+        self._row = 0
+
     def __hash__(self):
-        return "%x" % id(self)
+        return id(self)
 
     def data(self, role):
         return self._data.get(role)
@@ -1916,8 +5474,42 @@ class GenericTreeModelItem(object):
 
     def addChild(self, child):
         child._parent = self
+        child._row = len(self._children)
         self._children.append(child)
 
+    def addChildren(self, children):
+        self.insertChildren(len(self._children), children)
+
+    def insertChildren(self, row, children):
+        """Insert `children` at `row`, renumbering those that follow"""
+        for child in children:
+            child._parent = self
+
+        self._children[row:row] = children
+        self._renumber(row)
+
+    def removeChildren(self, row, count):
+        """Remove `count` children from `row`, renumbering those that follow
+
+        Returns:
+            list: The children removed
+
+        """
+
+        removed = self._children[row:row + count]
+        del self._children[row:row + count]
+
+        for child in removed:
+            child._parent = None
+
+        self._renumber(row)
+        return removed
+
+    def _renumber(self, start=0):
+        children = self._children
+        for row in range(start, len(children)):
+            children[row]._row = row
+
     def childCount(self):
         return len(self._children)
 
@@ -1928,10 +5520,7 @@ class GenericTreeModelItem(object):
         return self._parent
 
     def row(self):
-        if self._parent:
-            return self._parent._children.index(self)
-        else:
-            return 0
+        return self._row
 
 
 def _demo():
@@ -1,5 +1,9 @@
+import os
 import sys
+import array
+import shutil
 import logging
+import tempfile
 import argparse
 import contextlib
 
@@ -87,6 +91,690 @@ with __auto__("InfoList..") as parser:
     ])
 
 
+with __auto__("InfoList appended to..") as parser:
+    log = qargparse.InfoList("log", default=[], maxlen=3)
+    log.extend(["a", "b"])
+    parser.add_arguments([log])
+    log.append("c")
+    log.extend(["d", "e"])
+
+    # Shown together, once back in the event loop
+    assert log._model.rowCount() == 2, log._model.rowCount()
+    _app.processEvents()
+    assert log._model.rowCount() == 3, log._model.rowCount()
+
+    # Dropping the oldest
+    assert log.read() == ["c", "d", "e"], log.read()
+    log.write(["f", "g", "h", "i"])
+    assert log.read() == ["g", "h", "i"], log.read()
+
+    # Keeping every line, by default
+    everything = qargparse.InfoList("everything", default=[])
+    parser.add_arguments([everything])
+    everything.extend(str(index) for index in range(20000))
+    _app.processEvents()
+    assert everything._model.rowCount() == 20000
+    assert everything._model.index(19999, 0).data() == "19999"
+
+
+with __auto__("Images read in threads..") as parser:
+    tempdir = tempfile.mkdtemp()
+    paths = []
+
+    for color in ("red", "blue"):
+        image = qargparse.QtGui.QImage(1920, 1080,
+                                       qargparse.QtGui.QImage.Format_RGB32)
+        image.fill(qargparse.QtGui.QColor(color))
+        paths.append(os.path.join(tempdir, "%s.png" % color))
+        image.save(paths[-1])
+
+    image = parser.add_argument("image", type=qargparse.ImageButton)
+    image.write(paths[0])
+    image.write(paths[1])  # Overtaking the first
+
+    while qargparse._ImageLoader._running:
+        qargparse._ImageLoader._pool.waitForDone()
+        _app.processEvents()
+
+    pixmap = image._widget.icon().pixmap(image._size)
+    assert pixmap.width() <= image._size.width(), pixmap.size()
+    color = pixmap.toImage().pixelColor(pixmap.width() // 2, 1)
+    assert color == qargparse.QtGui.QColor("blue"), color.name()
+
+    shutil.rmtree(tempdir)
+
+
+with __auto__("Thumbnails..") as parser:
+    tempdir = tempfile.mkdtemp()
+    size = qargparse.QtCore.QSize(200, 100)
+    paths = []
+
+    for index in range(3):
+        image = qargparse.QtGui.QImage(2000, 1000,
+                                       qargparse.QtGui.QImage.Format_RGB32)
+        image.fill(qargparse.QtGui.QColor("red"))
+        paths.append(os.path.join(tempdir, "%d.png" % index))
+        image.save(paths[-1])
+
+    # Room for two thumbnails, of 200 x 100 x 4 bytes
+    cache = qargparse.ThumbnailCache(budget=200 * 100 * 4 * 2,
+                                     directory=os.path.join(tempdir, "cache"))
+
+    for path in paths:
+        assert cache.read(path, size).size() == size
+
+    assert cache.get(paths[0], size) is None
+    assert cache.get(paths[2], size) is not None
+    assert len(os.listdir(os.path.join(tempdir, "cache"))) == 3
+
+    # Read from disk, rather than the image itself
+    cache.clear()
+    mtime = os.stat(paths[0]).st_mtime
+    image.fill(qargparse.QtGui.QColor("blue"))
+    image.save(paths[0])
+    os.utime(paths[0], (mtime, mtime))
+    color = cache.read(paths[0], size).pixelColor(0, 0)
+    assert color == qargparse.QtGui.QColor("red"), color.name()
+
+    # Not once modified, as read rather than looked up in memory
+    cache.read(paths[2], size)
+    image.fill(qargparse.QtGui.QColor("green"))
+    image.save(paths[2])
+    os.utime(paths[2], (0, 0))
+    assert cache.get(paths[2], size) is not None
+    color = cache.read(paths[2], size).pixelColor(0, 0)
+    assert color == qargparse.QtGui.QColor("green"), color.name()
+
+    # Removed from disk, those least recently used first
+    directory = os.path.join(tempdir, "cache")
+    budget = sum(os.path.getsize(os.path.join(directory, name))
+                 for name in os.listdir(directory))
+    cache = qargparse.ThumbnailCache(directory=directory, diskBudget=budget)
+    os.utime(paths[1], (1, 1))
+    assert cache.read(paths[1], size).size() == size
+    assert len(os.listdir(directory)) < 5, os.listdir(directory)
+
+    # Shown without reading again, once read
+    qargparse.ImageButton.thumbnails = cache
+    try:
+        image = parser.add_argument("image", type=qargparse.ImageButton)
+        image.write(paths[2])
+
+        while qargparse._ImageLoader._running:
+            qargparse._ImageLoader._pool.waitForDone()
+            _app.processEvents()
+
+        image.write(paths[0])
+        image.write(paths[2])
+        assert not image._widget.icon().isNull()
+        assert image._widget.text() == "", image._widget.text()
+    finally:
+        qargparse.ImageButton.thumbnails = qargparse.ThumbnailCache()
+
+    shutil.rmtree(tempdir)
+
+
+with __auto__("Images of pixels..") as parser:
+    def color(widget):
+        image = widget.grab().toImage()
+        return image.pixelColor(image.width() // 2, image.height() // 2)
+
+    pixels = bytearray(b"\xff\x00\x00\xff" * 16 * 9)
+    buffer = qargparse.ImageBuffer(pixels, 16, 9)
+    image = parser.add_argument("image", type=qargparse.Image)
+    button = parser.add_argument("button", type=qargparse.ImageButton)
+    image.write(buffer)
+    button.write(buffer)
+    assert color(image.widget()).name() == "#ff0000"
+    assert color(button.widget()).name() == "#ff0000"
+
+    # Changed in place
+    pixels[:] = b"\x00\x00\xff\xff" * 16 * 9
+    image.write(buffer)
+    assert color(image.widget()).name() == "#0000ff"
+
+
+with __auto__("Choice and Enum items by index..") as parser:
+    items = ["node%d" % index for index in range(1000)]
+    choice = parser.add_argument("choice", type=qargparse.Choice, items=items)
+    enum = parser.add_argument("enum", type=qargparse.Enum, items=items)
+
+    # Defaults to the first item, also when given as None
+    assert choice.read() == "node0", choice.read()
+    assert enum.read() == 0, enum.read()
+
+    choice.write("node500")
+    enum.write("node500")
+    assert choice.index(choice.read()) == 500
+    assert enum.read() == 500
+    assert choice.isEdited() and enum.isEdited()
+
+    # Indexes follow items as they change
+    choice.reset(["b", "node500"], "node500")
+    assert choice.index("node500") == 1
+
+    # Fetched as they are needed
+    lazy = parser.add_argument("lazy", type=qargparse.Enum, lazy=True, items=(
+        "node%d" % index for index in range(5000)
+    ))
+    assert len(lazy["items"]) < 5000, len(lazy["items"])
+    lazy.write("node3000")
+    assert lazy.read() == 3000, lazy.read()
+    assert len(lazy["items"]) < 5000, len(lazy["items"])
+
+    # Typed into, without fetching every item
+    combobox = [
+        widget for widget in parser.findChildren(QtWidgets.QComboBox)
+        if widget.isEditable()
+    ][0]
+    line = combobox.lineEdit()
+    for text in ("n", "no", "not", "not a"):
+        line.setText(text)
+        line.textEdited.emit(text)
+
+    line.editingFinished.emit()
+    assert lazy.read() == 3000, lazy.read()
+    assert line.text() == "node3000", line.text()
+    assert len(lazy["items"]) < 5000, len(lazy["items"])
+
+
+with __auto__("Choice filtered by text..") as parser:
+    items = ["node%d" % index for index in range(1000)] + ["Big Node"]
+    choice = parser.add_argument("choice", type=qargparse.Choice,
+                                 items=items, filterable=True)
+    choice.write("node50")
+
+    search = parser.findChild(QtWidgets.QLineEdit)
+    view = parser.findChild(QtWidgets.QListView)
+    model = view.model()
+
+    search.setText("NODE50")
+    assert model.rowCount() == 11, model.rowCount()
+    assert view.currentIndex().data() == "node50"
+
+    # Every word, in any order
+    search.setText("node big")
+    assert model.stringList() == ["Big Node"], model.stringList()
+
+    # Hidden items remain current
+    assert choice.read() == "node50", choice.read()
+    choice.write("Big Node")
+    assert view.currentIndex().data() == "Big Node"
+
+    search.setText("")
+    assert model.rowCount() == 1001, model.rowCount()
+    assert view.currentIndex().row() == 1000, view.currentIndex().row()
+
+
+with __auto__("List of roles..") as parser:
+    def item(text, tip=None):
+        item = qargparse.ListItem({QtCore.Qt.DisplayRole: text})
+
+        if tip is not None:
+            item[QtCore.Qt.ToolTipRole] = tip
+
+        return item
+
+    lst = parser.add_argument("list", type=qargparse.List, items=[
+        item("a"), item("b", tip="B"),
+    ])
+    model = lst._model
+    assert lst.read() == "a", lst.read()
+    assert model.index(1, 0).data() == "b"
+
+    lst.extend([item("c"), item("d", tip="D")])
+    assert model.rowCount() == 4, model.rowCount()
+    assert model.index(0, 0).data(QtCore.Qt.UserRole) is None
+    assert [model.index(row, 0).data(QtCore.Qt.ToolTipRole)
+            for row in range(4)] == [None, "B", None, "D"]
+
+    # Replaces, rather than appends to, those before
+    lst.reset([item("e")])
+    assert model.rowCount() == 1, model.rowCount()
+    assert lst.read() == "e", lst.read()
+
+    lst.write("f")
+    assert lst.read() == "f", lst.read()
+
+
+with __auto__("Changing and changed..") as parser:
+    age = parser.add_argument("age", type=qargparse.Integer, max=100)
+    slider = age._slider
+    changing, changed = [], []
+    parser.changing.connect(lambda arg: changing.append(arg.read()))
+    parser.changed.connect(lambda arg: changed.append(arg.read()))
+
+    # Dragged, and committed once released
+    slider.setSliderDown(True)
+    for value in range(1, 11):
+        slider.setValue(value)
+    slider.setSliderDown(False)
+
+    assert changing == list(range(1, 11)), changing
+    assert changed == [10], changed
+    assert age.isEdited()
+
+    # Typed, and committed once editing is finished
+    del changing[:], changed[:]
+    spinbox = age._widget
+    spinbox.setValue(11)
+    spinbox.setValue(12)
+    spinbox.editingFinished.emit()
+    spinbox.editingFinished.emit()
+
+    assert changing == [11, 12], changing
+    assert changed == [12], changed
+    assert slider.value() == 12, slider.value()
+
+    # Written, and committed right away
+    del changing[:], changed[:]
+    age.write(13)
+
+    assert changing == [], changing
+    assert changed == [13], changed
+    assert slider.value() == 13, slider.value()
+
+    # At most once per interval, of the latest value
+    del changing[:], changed[:]
+    parser.setChangeInterval(50)
+
+    for value in range(20, 30):
+        age.write(value)
+
+    assert changed == [20], changed
+
+    while parser._throttle_timer.isActive():
+        _app.processEvents()
+
+    assert changed == [20, 29], changed
+
+    # In order of their latest change
+    height = parser.add_argument("height", type=qargparse.Integer)
+    names = []
+    parser.changed.connect(lambda arg: names.append(arg["name"]))
+
+    age.write(30)
+    age.write(31)
+    height.write(1)
+    age.write(32)
+
+    while parser._throttle_timer.isActive():
+        _app.processEvents()
+
+    assert names == ["age", "height", "age"], names
+
+
+with __manual__("Storage backends.."):
+    tempdir = tempfile.mkdtemp()
+    snapshot = os.path.join(tempdir, "snapshot.bin")
+
+    for storage in (qargparse.JsonStorage(os.path.join(tempdir, "a.json")),
+                    qargparse.SqliteStorage(os.path.join(tempdir, "a.db"))):
+        parser = qargparse.QArgumentParser(storage=storage)
+        parser.add_argument("age", default=33).write(34)
+        parser.add_argument("alive", default=True).write(False)
+        pet = parser.add_argument("pet", type=qargparse.Enum,
+                                  items=["Cat", "Dog"])
+        pet.write("Dog")
+        parser.flush()
+
+        # Stored as native types, with an Enum by item
+        stored = storage.load_all()
+        assert stored == {"age": 34, "alive": False, "pet": "Dog"}, stored
+
+        qargparse.SnapshotStorage.write(snapshot, stored)
+
+        for storage in (storage, qargparse.SnapshotStorage(snapshot)):
+            parser = qargparse.QArgumentParser(storage=storage)
+            assert parser.add_argument("age", default=33).read() == 34
+            assert parser.add_argument("alive", default=True).read() is False
+            pet = parser.add_argument("pet", type=qargparse.Enum,
+                                      items=["Dog", "Cat"])
+            assert pet.read() == 0, pet.read()
+
+    shutil.rmtree(tempdir)
+
+    parser.show()
+    _kill(parser)
+
+
+with __manual__("Write-back persistence.."):
+    settings = QtCore.QSettings(QtCore.QSettings.IniFormat,
+                                QtCore.QSettings.UserScope,
+                                __name__, "test.py")
+    settings.clear()
+
+    parser = qargparse.QArgumentParser(storage=settings)
+    age = parser.add_argument("age", default=33)
+    alive = parser.add_argument("alive", default=True)
+
+    age.write(34)
+    age.write(35)
+    alive.write(False)
+    parser.flush()
+
+    assert int(settings.value("age")) == 35, settings.value("age")
+    assert settings.value("alive") in (False, "false"), settings.value("alive")
+
+    # Stored values are initial values, the default is kept for reset
+    parser = qargparse.QArgumentParser(storage=settings)
+    age = parser.add_argument("age", default=33)
+    assert age.read() == 35, age.read()
+    assert age.isEdited()
+
+    parser.show()
+    _kill(parser)
+
+
+with __auto__("Bulk arguments..") as parser:
+    args = parser.add_arguments([
+        qargparse.String("name", default="Marcus"),
+        qargparse.Integer("age", default=33, initial=34),
+        qargparse.Boolean("alive", default=True),
+    ])
+
+    assert [arg["name"] for arg in parser] == ["name", "age", "alive"]
+    assert args[1]["edited"], "initial value should count as edited"
+    assert not args[2]["edited"]
+
+
+with __auto__("Conditions..") as parser:
+    calls = []
+
+    def condition():
+        calls.append(True)
+        return alive.read()
+
+    alive = parser.add_argument("alive", default=True)
+    age = parser.add_argument("age", default=33)
+    height = qargparse.Float("height", default=1.87)
+    height["condition"] = condition
+    parser.add_arguments([height])
+
+    assert len(calls) == 1, calls
+    calls[:] = []
+
+    age.write(34)
+    assert not calls, "condition didn't read age, shouldn't be evaluated"
+
+    alive.write(False)
+    assert calls, "condition read alive, should be evaluated"
+    assert not height["enabled"]
+
+    alive.write(True)
+    assert height["enabled"]
+
+
+with __auto__("Reset on demand..") as parser:
+    age = parser.add_argument("age", default=33)
+    assert age["_reset"] is None, "reset shouldn't exist before an edit"
+
+    age.write(34)
+    assert age["_reset"] is not None
+
+    age["_reset"].pressed.emit()
+    assert age.read() == 33, age.read()
+
+
+with __manual__("Virtual.."):
+    args = [qargparse.Integer("arg%d" % index) for index in range(500)]
+    parser = qargparse.QArgumentParser(args, virtual=True)
+    parser.resize(300, 200)
+    parser.show()
+    _app.processEvents()
+
+    # Only those in view have widgets
+    assert args[0]["_widget"] is not None
+    assert args[-1]["_widget"] is None
+
+    # Values are kept without a widget
+    args[-1].write(5)
+    assert args[-1].read() == 5
+    assert args[-1]["edited"]
+
+    # Every row may be scrolled to, also those added once
+    # rows of their type have been measured
+    parser.add_arguments([
+        qargparse.Integer("more%d" % index) for index in range(300)
+    ])
+    last = parser._virtual._arguments[-1]
+    _app.processEvents()
+
+    scroll = parser._virtual._scroll.verticalScrollBar()
+    assert scroll.maximum() > 0, scroll.maximum()
+    scroll.setValue(scroll.maximum())
+    _app.processEvents()
+    assert last["_widget"] is not None
+
+    _kill(parser)
+
+
+with __manual__("Virtual rows released and bound again.."):
+    table = qargparse.Table("table", items=[
+        {QtCore.Qt.DisplayRole: ("a", "1")},
+        {QtCore.Qt.DisplayRole: ("b", "2")},
+    ])
+    lst = qargparse.List("list", items=[
+        qargparse.ListItem({QtCore.Qt.DisplayRole: "a"}),
+        qargparse.ListItem({QtCore.Qt.DisplayRole: "b"}),
+    ])
+    log = qargparse.InfoList("log", default=["x"])
+    image = qargparse.Image("image")
+    button = qargparse.ImageButton("button")
+    args = [image, button, table, lst, log]
+    args += [qargparse.Integer("arg%d" % index) for index in range(200)]
+    parser = qargparse.QArgumentParser(args, virtual=True)
+    parser.resize(300, 1200)
+    parser.show()
+    _app.processEvents()
+
+    table.reset(table.rows(), current="b")
+    lst.reset(list(lst["items"]), current=1)
+    log.write(["l1", "l2"])
+    log.append("l3")
+
+    pixmap = qargparse.QtGui.QPixmap(16, 9)
+    pixmap.fill(qargparse.QtGui.QColor("red"))
+    image.write(pixmap)
+    button.write(pixmap)
+    assert table.read() == "b", table.read()
+    assert lst.read() == "b", lst.read()
+
+    # Scroll out of view, and back again
+    scroll = parser._virtual._scroll.verticalScrollBar()
+    scroll.setValue(scroll.maximum())
+    _app.processEvents()
+    assert table["_widget"] is None
+    assert lst["_widget"] is None
+    assert log["_widget"] is None
+    assert image["_widget"] is None
+    assert button["_widget"] is None
+    assert table.read() == "b", table.read()
+    assert lst.read() == "b", lst.read()
+    assert log.read() == ["l1", "l2", "l3"], log.read()
+
+    scroll.setValue(0)
+    _app.processEvents()
+    assert table["_widget"] is not None
+    assert lst["_widget"] is not None
+    assert log["_widget"] is not None
+    assert table.read() == "b", table.read()
+    assert lst.read() == "b", lst.read()
+    assert log.read() == ["l1", "l2", "l3"], log.read()
+    assert image["_widget"].pixmap().size() == pixmap.size()
+    assert not button.pixmap().isNull()
+    assert table.rows() == [
+        {QtCore.Qt.DisplayRole: ("a", "1")},
+        {QtCore.Qt.DisplayRole: ("b", "2")},
+    ]
+    assert [item[QtCore.Qt.DisplayRole] for item in lst["items"]] == [
+        "a", "b"
+    ]
+    assert lst._model.index(0, 0).data() == "a"
+
+    _kill(parser)
+
+
+with __auto__("Headless..") as parser:
+    age = qargparse.Integer("age", default=33)
+    en = qargparse.Enum("myOptions", items=["a", "b", "c"])
+
+    # No widgets yet
+    age.write("34")
+    en.write("c")
+    assert age.read() == 34, age.read()
+    assert age.isEdited()
+    assert en.read() == 2, en.read()
+
+    table = qargparse.Table("table")
+    columns = qargparse.Table("columns", columns=[["a"], [1]])
+    rows = [
+        {QtCore.Qt.DisplayRole: ("b", 2)},
+        {QtCore.Qt.DisplayRole: ("c", 3)},
+    ]
+    table.reset(rows)
+    columns.reset(rows)
+    assert table.rows() == rows, table.rows()
+    assert columns.rows() == rows, columns.rows()
+
+    # Values carry over into widgets
+    parser.add_arguments([age, en, table, columns])
+    assert age["_widget"] is not None
+    assert age.read() == 34, age.read()
+    assert en.read() == 2, en.read()
+    assert table._model.rowCount() == 2, table._model.rowCount()
+    assert columns._model.index(1, 0).data() == "c"
+
+
+with __auto__("Table rows..") as parser:
+    table = parser.add_argument("table", type=qargparse.Table, items=[
+        {QtCore.Qt.DisplayRole: ("key%d" % row, "value")}
+        for row in range(5)
+    ])
+
+    root = qargparse.GenericTreeModelItem()
+    root.addChildren([qargparse.GenericTreeModelItem() for _ in range(5)])
+    first = root.child(0)
+    root.insertChildren(0, [qargparse.GenericTreeModelItem()])
+    root.removeChildren(3, 2)
+
+    assert first.row() == 1, first.row()
+    assert [root.child(row).row() for row in range(4)] == [0, 1, 2, 3]
+    assert first in set([first])
+
+    # Incremental changes, keeping rows which remain
+    model = table._model
+    removed = []
+    model.rowsRemoved.connect(
+        lambda parent, first, last: removed.append(first)
+    )
+    model.modelReset.connect(lambda: removed.append("reset"))
+
+    items = list(table["items"])
+    del items[1]
+    items.append({QtCore.Qt.DisplayRole: ("key5", "value")})
+    table.diff_reset(items)
+
+    assert removed == [1], removed
+    assert [model.index(row, 0).data() for row in range(5)] == [
+        "key0", "key2", "key3", "key4", "key5"
+    ]
+
+    # Columns, rather than items
+    table = parser.add_argument("columns", type=qargparse.Table, columns=[
+        ["key0", "key1"], array.array("i", [0, 1]),
+    ])
+    table.insert_rows(1, [{QtCore.Qt.DisplayRole: ("key2", 2)}])
+    model = table._model
+
+    assert [model.index(row, 1).data() for row in range(3)] == [0, 2, 1]
+    assert table["columns"][1].tolist() == [0, 2, 1]
+
+    # Rows fetched from a function, as the user scrolls
+    def fetch(offset, count):
+        return [
+            {QtCore.Qt.DisplayRole: ("key%d" % row, "value")}
+            for row in range(offset, min(offset + count, 150))
+        ]
+
+    table = parser.add_argument("paged", type=qargparse.Table, items=fetch)
+    table.fetch_more()
+    assert table.can_fetch_more()
+    table.fetch_more()
+    assert not table.can_fetch_more()
+    assert table._model.rowCount() == 150, table._model.rowCount()
+
+    # Sorted and filtered in the background
+    items = [
+        {QtCore.Qt.DisplayRole: (name, size)}
+        for name, size in (("b", 2), ("a", 3), ("ab", 1))
+    ]
+    table = parser.add_argument("sorted", type=qargparse.Table,
+                                sortable=True, filterable=True, items=items)
+
+    view = table["_widget"].findChild(qargparse.GenericTreeView)
+    proxy = view.model()
+    view.sortByColumn(1, QtCore.Qt.AscendingOrder)
+    proxy.setFilter("A")
+
+    proxy._pool.waitForDone()
+    _app.processEvents()  # Rows are applied in the GUI thread
+
+    assert not proxy.isPending()
+    assert [proxy.index(row, 0).data() for row in range(2)] == ["ab", "a"]
+
+    # Rows inserted and removed apart from changes of layout,
+    # which may not change the number of rows
+    counts, inserted, removed = [], [], []
+    proxy.layoutAboutToBeChanged.connect(
+        lambda: counts.append(proxy.rowCount())
+    )
+    proxy.layoutChanged.connect(lambda: counts.append(proxy.rowCount()))
+    proxy.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    proxy.rowsRemoved.connect(
+        lambda parent, first, last: removed.append((first, last))
+    )
+
+    table.insert_rows(0, [{QtCore.Qt.DisplayRole: ("ac", 0)}])
+    proxy._pool.waitForDone()
+    _app.processEvents()
+
+    assert inserted == [(2, 2)], inserted
+    assert [proxy.index(row, 0).data() for row in range(3)] == [
+        "ac", "ab", "a"
+    ]
+
+    proxy.setFilter("B")
+    proxy._pool.waitForDone()
+    _app.processEvents()
+
+    assert inserted == [(2, 2), (3, 3)], inserted
+    assert removed == [(2, 3)], removed
+    assert [proxy.index(row, 0).data() for row in range(2)] == ["ab", "b"]
+    assert counts[::2] == counts[1::2], counts
+
+    proxy.setFilter("A")
+    proxy._pool.waitForDone()
+    _app.processEvents()
+
+    # Replaced, in a single reset
+    resets = []
+    proxy.modelAboutToBeReset.connect(lambda: resets.append("begin"))
+    proxy.modelReset.connect(lambda: resets.append("end"))
+    source = qargparse.GenericTableModel()
+    source.reset([["c", "ca"], [1, 2]])
+    proxy.setSourceModel(source)
+
+    proxy._pool.waitForDone()
+    _app.processEvents()
+
+    assert resets == ["begin", "end"], resets
+    assert proxy.rowCount() == 1, proxy.rowCount()
+    assert proxy.index(0, 0).data() == "ca", proxy.index(0, 0).data()
+
+
 with __auto__("Enum..") as parser:
     en = parser.add_argument("myOptions", default=1, items=["a", "b", "c"],
                              type=qargparse.Enum)
@@ -140,7 +828,7 @@ with __manual__("Explicit persistence.."):
 with __manual__("Implicit persistence.."):
     parser = qargparse.QArgumentParser(storage=True)
     parser.clear()
-    parser._storage.setValue("name", "Marcus")
+    parser._storage.save_many({"name": "Marcus"})
     name = parser.add_argument("name")
 
     # Coming from settings